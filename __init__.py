@@ -10,6 +10,14 @@ Three workflow patterns:
 designed for easy swap to real APIs.
 """
 
-from .runner import run_workflow, run_sync, get_chat_client
+__all__ = ["run_workflow", "run_sync", "get_chat_client"]
 
-__all__ = ["run_workflow", "run_sync", "get_chat_client"]
\ No newline at end of file
+
+def __getattr__(name):
+    # Lazy re-exports (PEP 562): the runner drags in the agent_framework /
+    # Azure SDK import stack, which costs hundreds of ms — don't pay it
+    # until someone actually asks for a workflow entry point.
+    if name in __all__:
+        from . import runner
+        return getattr(runner, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
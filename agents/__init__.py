@@ -4,4 +4,6 @@ from .definitions import (
     create_packing_agent,
     create_activities_agent,
     create_booking_agent,
+    create_codeact_travel_agent,
+    create_multi_perspective_agent,
 )
\ No newline at end of file
@@ -4,74 +4,346 @@ Agent definitions for the travel assistant.
 Each agent is created via chat_client.as_agent() following the official MAF pattern.
 Tools use the @ai_function decorator for automatic schema inference.
 
+The agent_framework / Azure SDK import stack costs hundreds of ms, so it
+is only pulled in when an agent is actually created — importing this
+module (e.g. for the mock data, CodeAct execution, or `--help`) stays
+cheap.
+
 Agents:
   - TriageAgent: classifies intent, hands off to specialists
   - WeatherAgent: current weather and forecasts
   - PackingAgent: packing lists and luggage tips
   - ActivitiesAgent: things to do and local tips
   - BookingAgent: flight/hotel search and booking
+  - CodeActTravelAgent: single agent that answers with one Python block
+    calling the tools directly (no handoff round-trips)
 """
 
-from agent_framework import tool, ChatAgent
-from agent_framework.azure import AzureOpenAIChatClient
+from __future__ import annotations
+
+import io
+import os
+import ast
+import json
+import asyncio
+import builtins
+import contextlib
+import inspect
+import re
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from agent_framework import ChatAgent
+    from agent_framework.azure import AzureOpenAIChatClient
 
 from ..mock_data import (
+    _dumps, _loads,
     mock_packing_list, mock_luggage_restrictions,
     mock_activities, mock_local_tips,
     mock_search_flights, mock_search_hotels, mock_book_flight, mock_book_hotel,
 )
 from ..weather_api import live_weather, live_forecast
+from ..speculative import speculative_tools
+
+
+# ═══════════════════════════ Tool-result caches ═══════════════════════════
+
+# The mock-backed tools are pure functions of their arguments, and the demo
+# repeats the same destinations across scenarios and handoff retries — an LRU
+# turns those repeat lookups into dict hits. The live weather tools get a
+# short TTL instead so real-API staleness stays bounded.
+
+# Eval and benchmark runs that need every call to hit the backend fresh
+# can set TRAVEL_ASSISTANT_NO_CACHE=1 to bypass the TTL cache (the pure
+# mock LRUs below stay on — their results can't go stale).
+_CACHE_DISABLED = os.getenv("TRAVEL_ASSISTANT_NO_CACHE", "") == "1"
+
+_cached_packing_list = lru_cache(maxsize=512)(mock_packing_list)
+_cached_luggage_restrictions = lru_cache(maxsize=512)(mock_luggage_restrictions)
+_cached_activities = lru_cache(maxsize=512)(mock_activities)
+_cached_local_tips = lru_cache(maxsize=512)(mock_local_tips)
+
+
+class _TTLCache:
+    """Small time-bounded cache for live API results."""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0) -> None:
+        self._entries: dict[tuple, tuple[float, str]] = {}
+        self._maxsize = maxsize
+        self._ttl = ttl
+
+    def get_or_call(self, fn, *args) -> str:
+        if _CACHE_DISABLED:
+            return fn(*args)
+        key = (fn.__name__, *args)
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and now - entry[0] < self._ttl:
+            return entry[1]
+        value = fn(*args)
+        if len(self._entries) >= self._maxsize:
+            # Evict the oldest insertion (dicts preserve insertion order).
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (now, value)
+        return value
+
+
+_weather_cache = _TTLCache(maxsize=256, ttl=300.0)
 
 
 # ═══════════════════════════ Tools ═══════════════════════════
 
+# Plain callables — the @tool wrapping happens lazily in _load_tools() so
+# importing this module doesn't drag in the framework.
+
 # ── Weather tools ──
-@tool(name="get_weather", description="Get current weather conditions for a travel destination.")
 def get_weather(destination: str) -> str:
-    return live_weather(destination)
+    # A speculative prefetch may already have this in flight (see runner).
+    speculated = speculative_tools.take("get_weather", (destination,))
+    if speculated is not None:
+        return speculated
+    return _weather_cache.get_or_call(live_weather, destination)
 
-@tool(name="get_forecast", description="Get a multi-day weather forecast for a travel destination.")
 def get_forecast(destination: str, days: int = 5) -> str:
-    return live_forecast(destination, days)
+    return _weather_cache.get_or_call(live_forecast, destination, days)
 
 # ── Packing tools ──
-@tool(name="get_packing_list", description="Generate a packing list based on weather conditions and trip type (general/business/hiking/beach/city).")
 def get_packing_list(weather_summary: str, trip_type: str = "general") -> str:
-    return mock_packing_list(weather_summary, trip_type)
+    return _cached_packing_list(weather_summary, trip_type)
 
-@tool(name="check_luggage_restrictions", description="Check airline luggage restrictions, weight limits, and prohibited items.")
 def check_luggage_restrictions(airline: str = "general") -> str:
-    return mock_luggage_restrictions(airline)
+    return _cached_luggage_restrictions(airline)
 
 # ── Activities tools ──
-@tool(name="get_activities", description="Get activity suggestions for a destination. Category: all/sightseeing/food/outdoor/culture.")
 def get_activities(destination: str, category: str = "all") -> str:
-    return mock_activities(destination, category)
+    return _cached_activities(destination, category)
 
-@tool(name="get_local_tips", description="Get local tips: currency, language basics, safety, and transport for a destination.")
 def get_local_tips(destination: str) -> str:
-    return mock_local_tips(destination)
+    return _cached_local_tips(destination)
 
 # ── Booking tools ──
-@tool(name="search_flights", description="Search for available flights from origin to destination on a given date.")
 def search_flights(origin: str, destination: str, date: str = "2025-03-01") -> str:
     return mock_search_flights(origin, destination, date)
 
-@tool(name="search_hotels", description="Search for available hotels at a destination for a check-in date and number of nights.")
 def search_hotels(destination: str, checkin: str = "2025-03-01", nights: int = 3) -> str:
     return mock_search_hotels(destination, checkin, nights)
 
-@tool(name="book_flight", description="Book a specific flight by flight ID for a passenger.")
 def book_flight(flight_id: str, passenger_name: str) -> str:
     return mock_book_flight(flight_id, passenger_name)
 
-@tool(name="book_hotel", description="Book a specific hotel by hotel ID for a guest.")
 def book_hotel(hotel_id: str, guest_name: str, nights: int = 3) -> str:
     return mock_book_hotel(hotel_id, guest_name, nights)
 
+# ── Composite tools ──
+# The atomic calls above are independent I/O, so the common two-tool paths
+# (flights+hotels, weather+forecast) dispatch both halves concurrently:
+# latency drops from t(a)+t(b) to max(t(a), t(b)).
+
+async def search_trip(origin: str, destination: str, date: str = "2025-03-01", nights: int = 3) -> str:
+    flights, hotels = await asyncio.gather(
+        asyncio.to_thread(mock_search_flights, origin, destination, date),
+        asyncio.to_thread(mock_search_hotels, destination, date, nights),
+    )
+    return _dumps({"flights": _loads(flights), "hotels": _loads(hotels)})
+
+async def get_weather_report(destination: str, days: int = 5) -> str:
+    current, forecast = await asyncio.gather(
+        asyncio.to_thread(_weather_cache.get_or_call, live_weather, destination),
+        asyncio.to_thread(_weather_cache.get_or_call, live_forecast, destination, days),
+    )
+    return _dumps({"current": _loads(current), "forecast": _loads(forecast)})
+
+
+_TOOL_DESCRIPTIONS = {
+    get_weather: "Get current weather conditions for a travel destination.",
+    get_forecast: "Get a multi-day weather forecast for a travel destination.",
+    get_packing_list: "Generate a packing list based on weather conditions and trip type (general/business/hiking/beach/city).",
+    check_luggage_restrictions: "Check airline luggage restrictions, weight limits, and prohibited items.",
+    get_activities: "Get activity suggestions for a destination. Category: all/sightseeing/food/outdoor/culture.",
+    get_local_tips: "Get local tips: currency, language basics, safety, and transport for a destination.",
+    search_flights: "Search for available flights from origin to destination on a given date.",
+    search_hotels: "Search for available hotels at a destination for a check-in date and number of nights.",
+    book_flight: "Book a specific flight by flight ID for a passenger.",
+    book_hotel: "Book a specific hotel by hotel ID for a guest.",
+    search_trip: "Search flights and hotels for a trip in one call. Use this instead of separate flight/hotel searches when the user wants both.",
+    get_weather_report: "Get current weather and a multi-day forecast for a destination in one call.",
+}
+
+
+@lru_cache(maxsize=1)
+def _load_tools() -> dict[str, Any]:
+    """Wrap the plain callables with @tool on first agent creation."""
+    from agent_framework import tool
+
+    return {
+        fn.__name__: tool(name=fn.__name__, description=description)(fn)
+        for fn, description in _TOOL_DESCRIPTIONS.items()
+    }
+
+
+# ═══════════════════════════ CodeAct execution ═══════════════════════════
+
+# The callables a CodeAct block may use — the plain tool functions above,
+# so generated code runs in-process (with the same caches and speculative
+# prefetch) and costs no extra model turns.
+_CODEACT_NAMESPACE = {
+    "get_weather": get_weather,
+    "get_forecast": get_forecast,
+    "get_packing_list": get_packing_list,
+    "check_luggage_restrictions": check_luggage_restrictions,
+    "get_activities": get_activities,
+    "get_local_tips": get_local_tips,
+    "search_flights": search_flights,
+    "search_hotels": search_hotels,
+    "book_flight": book_flight,
+    "book_hotel": book_hotel,
+}
+
+# Builtins the generated code is allowed to touch — enough for glueing
+# tool results together, nothing that reaches the filesystem or network.
+_CODEACT_BUILTINS = {
+    name: getattr(builtins, name)
+    for name in (
+        "print", "len", "range", "enumerate", "zip", "sorted", "reversed",
+        "min", "max", "sum", "round", "abs",
+        "str", "int", "float", "bool", "list", "dict", "set", "tuple",
+    )
+}
+
+_CODE_BLOCK_RE = re.compile(r"```(?:python)?\s*\n(.*?)```", re.DOTALL)
+
+
+def extract_code_block(text: str) -> str | None:
+    """Pull the first ```python``` block out of a model response."""
+    match = _CODE_BLOCK_RE.search(text)
+    return match.group(1) if match else None
+
+
+def execute_code_block(code: str) -> str:
+    """
+    Execute a CodeAct block in a restricted namespace.
+
+    Only the tool callables, `json`, and a small builtins allowlist are
+    visible. Imports and underscore attribute access are rejected up
+    front via an AST walk. Returns whatever the block printed.
+    """
+    tree = ast.parse(code)
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            raise ValueError("CodeAct blocks may not import modules")
+        if isinstance(node, ast.Attribute) and node.attr.startswith("_"):
+            raise ValueError("CodeAct blocks may not access private attributes")
+
+    namespace = {"__builtins__": _CODEACT_BUILTINS, "json": json, **_CODEACT_NAMESPACE}
+    stdout = io.StringIO()
+    with contextlib.redirect_stdout(stdout):
+        exec(compile(tree, "<codeact>", "exec"), namespace)
+    return stdout.getvalue()
+
 
 # ═══════════════════════════ Agent Factories ═══════════════════════════
 
+# ═══════════════════════════ Agent instructions ═══════════════════════════
+
+# Module-level so the logger's trace metadata and the batched
+# multi-perspective prompt reuse the exact text the agents run with.
+
+# Byte-identical preamble shared by every agent. Azure OpenAI caches
+# prompt prefixes server-side, so agents whose system prompts start with
+# the exact same bytes turn the repeated prefill of those tokens into
+# cache hits — which matters most for the concurrent fan-out, where
+# three prompts would otherwise prefill the same preamble in parallel.
+# Keep edits here byte-stable across agents or the cache key changes.
+_SHARED_PROMPT_PREFIX = (
+    "You are part of a multi-agent travel assistant. The system routes each "
+    "traveller request to one or more specialist agents; you are one of those "
+    "specialists and you answer only within your speciality, trusting the "
+    "other agents to cover theirs.\n\n"
+    "House rules, shared by every agent in this system:\n"
+    "- Ground every factual claim in tool output. Call the tools you have "
+    "been given rather than guessing weather, prices, availability or "
+    "opening hours, and never invent numbers a tool could have returned.\n"
+    "- Tool results arrive as JSON strings. Read the fields you need and "
+    "present them in plain language with units (°C, km/h, EUR) — do not "
+    "paste raw JSON into your answer.\n"
+    "- Be concise and well organised. Prefer short paragraphs and compact "
+    "lists over long prose; lead with the answer, then add supporting "
+    "detail. Do not repeat information another agent has already given in "
+    "this conversation.\n"
+    "- Stay within the travel domain. For requests outside travel planning, "
+    "say briefly that you cannot help with that topic.\n"
+    "- If a tool fails or returns nothing useful, say so honestly and give "
+    "your best general guidance, clearly marked as such.\n"
+    "- Mention handoffs only by calling the handoff tool, never by telling "
+    "the user to ask another agent.\n\n"
+)
+
+_TRIAGE_INSTRUCTIONS = (
+    _SHARED_PROMPT_PREFIX +
+    "You are a travel assistant triage agent. Analyse the user's request and "
+    "route it to the appropriate specialist:\n\n"
+    "- For weather questions → call handoff_to_weather_agent\n"
+    "- For packing/luggage questions → call handoff_to_packing_agent\n"
+    "- For activity/sightseeing questions → call handoff_to_activities_agent\n"
+    "- For flight/hotel/booking questions → call handoff_to_booking_agent\n\n"
+    "If the request covers multiple topics, pick the most relevant specialist first. "
+    "The specialist can hand off to another if needed.\n"
+    "Be friendly and brief when responding directly."
+)
+
+_WEATHER_BRIEF = (
+    "You are a travel weather specialist. Use get_weather_report when the user "
+    "wants both current conditions and an outlook; otherwise use get_weather for "
+    "current conditions and get_forecast for multi-day outlooks. Summarise clearly: temperature, "
+    "conditions, rain chance. Highlight notable day-to-day changes in forecasts. "
+    "If the user also needs packing advice, call handoff_to_packing_agent. "
+    "If they need activities, call handoff_to_activities_agent."
+)
+_WEATHER_INSTRUCTIONS = _SHARED_PROMPT_PREFIX + _WEATHER_BRIEF
+
+_PACKING_INSTRUCTIONS = (
+    _SHARED_PROMPT_PREFIX +
+    "You are a travel packing specialist. Use the conversation's weather context "
+    "to call get_packing_list with an appropriate trip_type. Also offer luggage tips "
+    "via check_luggage_restrictions. Organise suggestions by category. Be concise."
+)
+
+_ACTIVITIES_BRIEF = (
+    "You are a local travel guide. Use get_activities for destination suggestions "
+    "and get_local_tips for practical advice. Highlight top-rated options and hidden "
+    "gems. Tailor to weather if context is available. Be enthusiastic but concise."
+)
+_ACTIVITIES_INSTRUCTIONS = _SHARED_PROMPT_PREFIX + _ACTIVITIES_BRIEF
+
+_BOOKING_BRIEF = (
+    "You are a travel booking specialist. Use search_trip when the user wants "
+    "flights and accommodation together; use search_flights or search_hotels for "
+    "one or the other. Show options with prices and ratings. Highlight best value and premium options. "
+    "When asked to book, use book_flight or book_hotel and confirm the reference. "
+    "Always confirm details before booking."
+)
+_BOOKING_INSTRUCTIONS = _SHARED_PROMPT_PREFIX + _BOOKING_BRIEF
+
+# One model turn instead of three parallel calls: the three concurrent
+# personas answer side by side in delimited sections (see
+# workflows/concurrent_batched.py).
+_MULTI_PERSPECTIVE_INSTRUCTIONS = (
+    _SHARED_PROMPT_PREFIX +
+    "You are a combined travel assistant answering as three specialists in a "
+    "single pass. Respond with exactly three sections in this format:\n"
+    "━━━ WEATHER ━━━\n<weather answer>\n"
+    "━━━ ACTIVITIES ━━━\n<activities answer>\n"
+    "━━━ BOOKING ━━━\n<booking answer>\n\n"
+    "Handoff tools are not available — cover every perspective yourself "
+    "using the tools provided. Persona briefs:\n\n"
+    "## WEATHER\n" + _WEATHER_BRIEF + "\n\n"
+    "## ACTIVITIES\n" + _ACTIVITIES_BRIEF + "\n\n"
+    "## BOOKING\n" + _BOOKING_BRIEF
+)
+
+
 def create_triage_agent(chat_client: AzureOpenAIChatClient) -> ChatAgent:
     """
     Triage agent — used as the start agent in HandoffBuilder.
@@ -80,73 +352,114 @@ def create_triage_agent(chat_client: AzureOpenAIChatClient) -> ChatAgent:
     are automatically registered by HandoffBuilder. The instructions tell the
     agent when to use each one.
     """
+    from agent_framework import ChatAgent
+
     return ChatAgent(
         name="triage_agent",
-        instructions=(
-            "You are a travel assistant triage agent. Analyse the user's request and "
-            "route it to the appropriate specialist:\n\n"
-            "- For weather questions → call handoff_to_weather_agent\n"
-            "- For packing/luggage questions → call handoff_to_packing_agent\n"
-            "- For activity/sightseeing questions → call handoff_to_activities_agent\n"
-            "- For flight/hotel/booking questions → call handoff_to_booking_agent\n\n"
-            "If the request covers multiple topics, pick the most relevant specialist first. "
-            "The specialist can hand off to another if needed.\n"
-            "Be friendly and brief when responding directly."
-        ),
+        instructions=_TRIAGE_INSTRUCTIONS,
         chat_client=chat_client,
     )
 
 
 def create_weather_agent(chat_client: AzureOpenAIChatClient) -> ChatAgent:
+    from agent_framework import ChatAgent
+
+    tools = _load_tools()
     return ChatAgent(
         name="weather_agent",
-        instructions=(
-            "You are a travel weather specialist. Use get_weather for current conditions "
-            "and get_forecast for multi-day outlooks. Summarise clearly: temperature, "
-            "conditions, rain chance. Highlight notable day-to-day changes in forecasts. "
-            "If the user also needs packing advice, call handoff_to_packing_agent. "
-            "If they need activities, call handoff_to_activities_agent."
-        ),
+        instructions=_WEATHER_INSTRUCTIONS,
         chat_client=chat_client,
-        tools=[get_weather, get_forecast],
+        tools=[tools["get_weather_report"], tools["get_weather"], tools["get_forecast"]],
     )
 
 
 def create_packing_agent(chat_client: AzureOpenAIChatClient) -> ChatAgent:
+    from agent_framework import ChatAgent
+
+    tools = _load_tools()
     return ChatAgent(
         name="packing_agent",
-        instructions=(
-            "You are a travel packing specialist. Use the conversation's weather context "
-            "to call get_packing_list with an appropriate trip_type. Also offer luggage tips "
-            "via check_luggage_restrictions. Organise suggestions by category. Be concise."
-        ),
+        instructions=_PACKING_INSTRUCTIONS,
         chat_client=chat_client,
-        tools=[get_packing_list, check_luggage_restrictions],
+        tools=[tools["get_packing_list"], tools["check_luggage_restrictions"]],
     )
 
 
 def create_activities_agent(chat_client: AzureOpenAIChatClient) -> ChatAgent:
+    from agent_framework import ChatAgent
+
+    tools = _load_tools()
     return ChatAgent(
         name="activities_agent",
-        instructions=(
-            "You are a local travel guide. Use get_activities for destination suggestions "
-            "and get_local_tips for practical advice. Highlight top-rated options and hidden "
-            "gems. Tailor to weather if context is available. Be enthusiastic but concise."
-        ),
+        instructions=_ACTIVITIES_INSTRUCTIONS,
         chat_client=chat_client,
-        tools=[get_activities, get_local_tips],
+        tools=[tools["get_activities"], tools["get_local_tips"]],
     )
 
 
 def create_booking_agent(chat_client: AzureOpenAIChatClient) -> ChatAgent:
+    from agent_framework import ChatAgent
+
+    tools = _load_tools()
     return ChatAgent(
         name="booking_agent",
+        instructions=_BOOKING_INSTRUCTIONS,
+        chat_client=chat_client,
+        tools=[
+            tools["search_trip"], tools["search_flights"], tools["search_hotels"],
+            tools["book_flight"], tools["book_hotel"],
+        ],
+    )
+
+
+def create_multi_perspective_agent(chat_client: AzureOpenAIChatClient) -> ChatAgent:
+    """
+    Combined agent covering the three concurrent perspectives in one call.
+
+    Carries the union of the weather, activities and booking tool sets so
+    a single completion can do everything the three-agent fan-out does.
+    """
+    from agent_framework import ChatAgent
+
+    tools = _load_tools()
+    return ChatAgent(
+        name="multi_perspective_agent",
+        instructions=_MULTI_PERSPECTIVE_INSTRUCTIONS,
+        chat_client=chat_client,
+        tools=[
+            tools["get_weather_report"], tools["get_weather"], tools["get_forecast"],
+            tools["get_activities"], tools["get_local_tips"],
+            tools["search_trip"], tools["search_flights"], tools["search_hotels"],
+            tools["book_flight"], tools["book_hotel"],
+        ],
+    )
+
+
+def create_codeact_travel_agent(chat_client: AzureOpenAIChatClient) -> ChatAgent:
+    """
+    CodeAct agent — answers in a single model turn.
+
+    Instead of the triage → specialist → tool → synthesis round-trips, the
+    model emits one ```python``` block that calls the tool functions
+    directly. The block is executed in-process by execute_code_block and
+    its stdout becomes the final answer, collapsing 3-4 model turns into 1.
+    """
+    from agent_framework import ChatAgent
+
+    signatures = "\n".join(
+        f"- {name}{inspect.signature(fn)}" for name, fn in _CODEACT_NAMESPACE.items()
+    )
+    return ChatAgent(
+        name="codeact_travel_agent",
         instructions=(
-            "You are a travel booking specialist. Use search_flights and search_hotels to "
-            "show options with prices and ratings. Highlight best value and premium options. "
-            "When asked to book, use book_flight or book_hotel and confirm the reference. "
-            "Always confirm details before booking."
+            "You are a travel assistant. Answer every request by writing ONE "
+            "```python``` code block that calls the functions below and prints "
+            "a friendly, complete answer for the user. Do not write any text "
+            "outside the code block. Each function returns a JSON string — "
+            "parse it with json.loads if you need individual fields.\n\n"
+            "Available functions:\n"
+            f"{signatures}\n\n"
+            "Imports are not allowed; json and basic builtins are available."
         ),
         chat_client=chat_client,
-        tools=[search_flights, search_hotels, book_flight, book_hotel],
-    )
\ No newline at end of file
+    )
@@ -0,0 +1,140 @@
+"""
+Batch evaluation via the OpenAI Batch API.
+
+The interactive demo pays per-request latency and full price for every
+workflow. Evaluation sweeps (dozens of queries re-run against prompt
+variants) don't need interactivity, so this module packages queued user
+prompts into a Batch API JSONL, uploads it once, polls until the batch
+completes, and parses the results file — 50% cheaper than synchronous
+calls and far higher effective throughput.
+
+Usage:
+  python -m travel_assistant.demo --batch queries.jsonl
+
+where queries.jsonl has one {"input": "..."} object (or one raw string)
+per line.
+"""
+
+import json
+import logging
+import os
+import time
+from typing import Any
+
+from openai import AzureOpenAI
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger("travel_assistant")
+
+_POLL_INTERVAL_S = 30
+
+# Single persona for batch sweeps — batch requests can't hand off or call
+# tools, so one combined travel-assistant prompt stands in for the roster.
+_BATCH_INSTRUCTIONS = (
+    "You are a travel assistant covering weather, packing, activities, and "
+    "flight/hotel booking questions. Answer clearly and concisely."
+)
+
+
+def _get_batch_client() -> AzureOpenAI:
+    """Raw Azure OpenAI client — the Batch API isn't exposed through the agent framework."""
+    return AzureOpenAI(
+        api_key=os.getenv("AZURE_OPENAI_API_KEY", ""),
+        azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT", ""),
+        api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2024-10-21"),
+    )
+
+
+def load_queries(path: str) -> list[str]:
+    """Read one query per line: either a JSON object with "input" or a raw string."""
+    queries = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                obj = json.loads(line)
+                queries.append(obj["input"] if isinstance(obj, dict) else str(obj))
+            except json.JSONDecodeError:
+                queries.append(line)
+    return queries
+
+
+def build_batch_requests(queries: list[str]) -> list[dict[str, Any]]:
+    """Package queries into Batch API request objects."""
+    deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT", "gpt-4o-mini")
+    return [
+        {
+            "custom_id": f"query-{i}",
+            "method": "POST",
+            # Azure's Batch API routes on "/chat/completions" — the
+            # "/v1/..." form is openai.com-only and gets rejected.
+            "url": "/chat/completions",
+            "body": {
+                "model": deployment,
+                "messages": [
+                    {"role": "system", "content": _BATCH_INSTRUCTIONS},
+                    {"role": "user", "content": query},
+                ],
+            },
+        }
+        for i, query in enumerate(queries)
+    ]
+
+
+def run_batch(queries_path: str, output_path: str | None = None) -> list[dict[str, Any]]:
+    """
+    Submit all queries as one batch, poll until done, and return the
+    parsed results (one dict per query, in input order).
+    """
+    queries = load_queries(queries_path)
+    requests = build_batch_requests(queries)
+    payload = "\n".join(json.dumps(r) for r in requests).encode("utf-8")
+
+    client = _get_batch_client()
+    # The service validates the upload's .jsonl filename, so send a
+    # (name, bytes) tuple rather than bare bytes.
+    input_file = client.files.create(file=("queries.jsonl", payload), purpose="batch")
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/chat/completions",
+        completion_window="24h",
+    )
+    logger.info("📦 Batch %s submitted: %d queries", batch.id, len(queries))
+    print(f"📦 Batch {batch.id} submitted with {len(queries)} queries — polling…")
+
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        time.sleep(_POLL_INTERVAL_S)
+        batch = client.batches.retrieve(batch.id)
+        print(f"   status: {batch.status}")
+
+    if batch.status != "completed":
+        raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+
+    raw = client.files.content(batch.output_file_id).text
+    by_id = {}
+    for line in raw.splitlines():
+        if line.strip():
+            obj = json.loads(line)
+            by_id[obj["custom_id"]] = obj
+
+    results = []
+    for i, query in enumerate(queries):
+        obj = by_id.get(f"query-{i}", {})
+        body = (obj.get("response") or {}).get("body", {})
+        choices = body.get("choices", [])
+        results.append({
+            "input": query,
+            "output": choices[0]["message"]["content"] if choices else "",
+        })
+
+    if output_path:
+        with open(output_path, "w", encoding="utf-8") as f:
+            for result in results:
+                f.write(json.dumps(result, ensure_ascii=False) + "\n")
+        print(f"📄 Results written to {output_path}")
+
+    return results
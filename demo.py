@@ -17,6 +17,7 @@ Prerequisites:
     AZURE_OPENAI_DEPLOYMENT=gpt-4o-mini
 """
 
+import io
 import os
 import sys
 import asyncio
@@ -25,76 +26,109 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
 sys.path.insert(0, parent_dir)
 
-from travel_assistant.runner import run_workflow
+# The runner drags in agent_framework, azure.identity and httpx; it is
+# imported inside the functions that need it so the --batch path (which
+# never touches the framework) and --profile setup don't pay for it.
 
 
-def header(title: str) -> None:
-    print("\n" + "=" * 80)
-    print(f"  🧳 {title}")
-    print("=" * 80 + "\n")
+def header(title: str) -> str:
+    return "\n" + "=" * 80 + f"\n  🧳 {title}\n" + "=" * 80 + "\n"
+
+
+# The five demo scenarios: (title, user request, workflow mode).
+SCENARIOS = [
+    (
+        "1. HANDOFF — Weather-Only Request",
+        "What's the weather like in Tokyo?",
+        "handoff",
+    ),
+    (
+        "2. HANDOFF — Booking Request",
+        "Find me flights from Dublin to Barcelona",
+        "handoff",
+    ),
+    (
+        "3. HANDOFF — Multi-Topic (Weather → Packing handoff)",
+        "What's the weather in Reykjavik and what should I pack for hiking?",
+        "handoff",
+    ),
+    (
+        "4. SEQUENTIAL — Weather → Packing Pipeline",
+        "What should I pack for a beach trip to Bali?",
+        "sequential",
+    ),
+    (
+        "5. CONCURRENT — Full Trip Overview (parallel agents)",
+        "Tell me everything about travelling to Galway, Ireland. "
+        "Check the weather, find flights from Dublin, and suggest activities.",
+        "concurrent",
+    ),
+]
+
+
+async def run_scenario(
+    title: str,
+    user_request: str,
+    mode: str,
+    sem: asyncio.Semaphore,
+    log_file: str,
+    trace_dir: str,
+    client,
+) -> None:
+    """
+    Run one demo scenario under the shared semaphore.
+
+    Output is buffered into a StringIO and flushed in one go after the
+    scenario completes, so the five parallel runs don't interleave their
+    streaming prints. The buffer is passed to run_workflow explicitly —
+    redirect_stdout swaps the process-global sys.stdout, and holding
+    that across awaits in concurrent tasks exits the redirects in
+    non-LIFO order, scrambling output between scenarios.
+    """
+    from travel_assistant.runner import run_workflow
+
+    async with sem:
+        buf = io.StringIO()
+        print(header(title), file=buf)
+        print(f"User: '{user_request}'\n", file=buf)
+        await run_workflow(
+            user_request,
+            mode=mode,
+            log_file=log_file,
+            trace_dir=trace_dir,
+            client=client,
+            out=buf,
+        )
+        print(buf.getvalue(), end="", flush=True)
 
 
 async def main() -> None:
+    from travel_assistant.runner import get_chat_client
+
     log_file = "travel_assistant/log/travel_assistant.log"
     trace_dir = "travel_assistant/log/traces"
 
 
-    header("TRAVEL ASSISTANT — MICROSOFT AGENT FRAMEWORK DEMO")
+    print(header("TRAVEL ASSISTANT — MICROSOFT AGENT FRAMEWORK DEMO"))
     print(f"📝 Event logs: {log_file}")
     print(f"📄 JSON traces: {trace_dir}/\n")
 
-    # ─── 1. HANDOFF: Weather-only request ───
-    header("1. HANDOFF — Weather-Only Request")
-    print("User: 'What's the weather like in Tokyo?'\n")
-    await run_workflow(
-        "What's the weather like in Tokyo?",
-        mode="handoff",
-        log_file=log_file,
-        trace_dir=trace_dir,
-    )
-
-    # ─── 2. HANDOFF: Booking request ───
-    header("2. HANDOFF — Booking Request")
-    print("User: 'Find me flights from Dublin to Barcelona'\n")
-    await run_workflow(
-        "Find me flights from Dublin to Barcelona",
-        mode="handoff",
-        log_file=log_file,
-        trace_dir=trace_dir,
-    )
-
-    # ─── 3. HANDOFF: Multi-topic (triage → weather → packing) ───
-    header("3. HANDOFF — Multi-Topic (Weather → Packing handoff)")
-    print("User: 'What's the weather in Reykjavik and what should I pack for hiking?'\n")
-    await run_workflow(
-        "What's the weather in Reykjavik and what should I pack for hiking?",
-        mode="handoff",
-        log_file=log_file,
-        trace_dir=trace_dir,
-    )
-
-    # ─── 4. SEQUENTIAL: Weather → Packing pipeline ───
-    header("4. SEQUENTIAL — Weather → Packing Pipeline")
-    print("User: 'What should I pack for a beach trip to Bali?'\n")
-    await run_workflow(
-        "What should I pack for a beach trip to Bali?",
-        mode="sequential",
-        log_file=log_file,
-        trace_dir=trace_dir,
-    )
-
-    # ─── 5. CONCURRENT: Full trip overview (all agents in parallel) ───
-    header("5. CONCURRENT — Full Trip Overview (parallel agents)")
-    print("User: 'Tell me everything about travelling to Galway, Ireland'\n")
-    await run_workflow(
-        "Tell me everything about travelling to Galway, Ireland. "
-        "Check the weather, find flights from Dublin, and suggest activities.",
-        mode="concurrent",
-        log_file=log_file,
-        trace_dir=trace_dir,
+    # All five scenarios are independent I/O-bound workflows, so dispatch
+    # them in parallel. The semaphore caps in-flight runs against Azure
+    # OpenAI rate limits (tune via DEMO_CONCURRENCY).
+    # One shared client for all scenarios — a single connection pool
+    # instead of a TLS handshake per workflow.
+    client = get_chat_client()
+
+    sem = asyncio.Semaphore(int(os.getenv("DEMO_CONCURRENCY", "5")))
+    await asyncio.gather(
+        *(
+            run_scenario(title, request, mode, sem, log_file, trace_dir, client)
+            for title, request, mode in SCENARIOS
+        )
     )
 
-    header("DEMO COMPLETE")
+    print(header("DEMO COMPLETE"))
     print(f"📝 Event logs: {log_file}")
     print(f"📄 JSON traces: {trace_dir}/")
     print("   Each trace has: input, agent instructions, tool calls, outputs, timing.")
@@ -102,4 +136,32 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    if "--batch" in sys.argv:
+        # Eval-sweep path: submit the queries file via the OpenAI Batch
+        # API (50% cost, no interactive streaming) instead of running
+        # workflows one by one.
+        from travel_assistant.batch import run_batch
+
+        queries_path = sys.argv[sys.argv.index("--batch") + 1]
+        results = run_batch(queries_path, output_path="batch_results.jsonl")
+        print(f"✅ {len(results)} batch results complete")
+    elif "--profile" in sys.argv:
+        # Python-level profile alongside the JSON traces: the tracer
+        # reports per-agent LLM latency, this shows where the Python
+        # side (tools, tracer, serialisation) spends its time.
+        import cProfile
+        import pstats
+        from datetime import datetime
+
+        prof = cProfile.Profile()
+        prof.enable()
+        asyncio.run(main())
+        prof.disable()
+
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        stats_path = f"travel_assistant/log/traces/prof_{ts}.pstats"
+        prof.dump_stats(stats_path)
+        print(f"📊 Profile saved: {stats_path}")
+        pstats.Stats(prof).sort_stats("cumulative").print_stats(30)
+    else:
+        asyncio.run(main())
\ No newline at end of file
@@ -13,12 +13,24 @@ Captures everything the evaluator/judge needs for prompt refinement:
 Outputs a JSON trace file per run + human-readable console summary.
 """
 
+import asyncio
+import atexit
 import json
 import logging
+import logging.handlers
 import os
+import queue
+import sys
+import time
+from collections import defaultdict, deque
 from datetime import datetime
 from typing import Any
 
+try:
+    import orjson  # 3-10x faster serialisation for trace-heavy runs
+except ImportError:
+    orjson = None
+
 from agent_framework import (
     AgentResponseUpdate,
     AgentRunUpdateEvent,
@@ -30,6 +42,21 @@ from agent_framework import (
 
 logger = logging.getLogger("travel_assistant")
 
+# Trailing streamed chunks retained per agent for the trace record. Very
+# long outputs get truncated from the front, which the evaluator can live
+# with; unbounded buffering can't be justified for multi-agent runs.
+_MAX_BUFFER_CHUNKS = 4096
+
+# Directories we've already created — skips the stat/mkdir syscall the
+# concurrent demo would otherwise race on for every trace save.
+_created_dirs: set[str] = set()
+
+
+def _ensure_dir(path: str) -> None:
+    if path and path not in _created_dirs:
+        os.makedirs(path, exist_ok=True)
+        _created_dirs.add(path)
+
 
 def setup_logging(level: int = logging.INFO, log_file: str | None = None) -> None:
     """Configure logging with console and optional file output."""
@@ -46,59 +73,55 @@ def setup_logging(level: int = logging.INFO, log_file: str | None = None) -> Non
     logger.addHandler(console)
 
     if log_file:
-        os.makedirs(os.path.dirname(log_file), exist_ok=True)
+        _ensure_dir(os.path.dirname(log_file))
         fh = logging.FileHandler(log_file, mode="a", encoding="utf-8")
         fh.setFormatter(formatter)
-        logger.addHandler(fh)
+        # Route file writes through a queue so the disk I/O happens on a
+        # background listener thread, not inside the async event loop.
+        # The console handler stays direct — stderr writes are cheap and
+        # keeping them synchronous preserves interactivity.
+        q: queue.SimpleQueue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(q, fh)
+        listener.start()
+        atexit.register(listener.stop)
+        logger.addHandler(logging.handlers.QueueHandler(q))
         logger.setLevel(level)
 
 
 # ─── Agent instruction registry ───
-# Hardcoded from definitions.py so traces always have the real prompts.
+# Sourced from definitions.py so traces always carry the exact prompts
+# the agents run with (definitions imports no framework code at module
+# level, so this stays cheap).
+
+from .agents.definitions import (
+    _ACTIVITIES_INSTRUCTIONS,
+    _BOOKING_INSTRUCTIONS,
+    _MULTI_PERSPECTIVE_INSTRUCTIONS,
+    _PACKING_INSTRUCTIONS,
+    _TRIAGE_INSTRUCTIONS,
+    _WEATHER_INSTRUCTIONS,
+)
 
 _AGENT_INSTRUCTIONS = {
-    "triage_agent": (
-        "You are a travel assistant triage agent. Analyse the user's request and "
-        "route it to the appropriate specialist:\n\n"
-        "- For weather questions → call handoff_to_weather_agent\n"
-        "- For packing/luggage questions → call handoff_to_packing_agent\n"
-        "- For activity/sightseeing questions → call handoff_to_activities_agent\n"
-        "- For flight/hotel/booking questions → call handoff_to_booking_agent\n\n"
-        "If the request covers multiple topics, pick the most relevant specialist first. "
-        "The specialist can hand off to another if needed.\n"
-        "Be friendly and brief when responding directly."
-    ),
-    "weather_agent": (
-        "You are a travel weather specialist. Use get_weather for current conditions "
-        "and get_forecast for multi-day outlooks. Summarise clearly: temperature, "
-        "conditions, rain chance. Highlight notable day-to-day changes in forecasts. "
-        "If the user also needs packing advice, call handoff_to_packing_agent. "
-        "If they need activities, call handoff_to_activities_agent."
-    ),
-    "packing_agent": (
-        "You are a travel packing specialist. Use the conversation's weather context "
-        "to call get_packing_list with an appropriate trip_type. Also offer luggage tips "
-        "via check_luggage_restrictions. Organise suggestions by category. Be concise."
-    ),
-    "activities_agent": (
-        "You are a local travel guide. Use get_activities for destination suggestions "
-        "and get_local_tips for practical advice. Highlight top-rated options and hidden "
-        "gems. Tailor to weather if context is available. Be enthusiastic but concise."
-    ),
-    "booking_agent": (
-        "You are a travel booking specialist. Use search_flights and search_hotels to "
-        "show options with prices and ratings. Highlight best value and premium options. "
-        "When asked to book, use book_flight or book_hotel and confirm the reference. "
-        "Always confirm details before booking."
-    ),
+    "triage_agent": _TRIAGE_INSTRUCTIONS,
+    "weather_agent": _WEATHER_INSTRUCTIONS,
+    "packing_agent": _PACKING_INSTRUCTIONS,
+    "activities_agent": _ACTIVITIES_INSTRUCTIONS,
+    "booking_agent": _BOOKING_INSTRUCTIONS,
+    "multi_perspective_agent": _MULTI_PERSPECTIVE_INSTRUCTIONS,
 }
 
 _AGENT_TOOLS = {
     "triage_agent": [],
-    "weather_agent": ["get_weather", "get_forecast"],
+    "weather_agent": ["get_weather_report", "get_weather", "get_forecast"],
     "packing_agent": ["get_packing_list", "check_luggage_restrictions"],
     "activities_agent": ["get_activities", "get_local_tips"],
-    "booking_agent": ["search_flights", "search_hotels", "book_flight", "book_hotel"],
+    "booking_agent": ["search_trip", "search_flights", "search_hotels", "book_flight", "book_hotel"],
+    "multi_perspective_agent": [
+        "get_weather_report", "get_weather", "get_forecast",
+        "get_activities", "get_local_tips",
+        "search_trip", "search_flights", "search_hotels", "book_flight", "book_hotel",
+    ],
 }
 
 
@@ -118,21 +141,44 @@ class WorkflowTracer:
             "timestamp": datetime.now().isoformat(),
             "mode": mode,
             "input": user_input,
-            "agents": {},
+            # Pre-materialise entries for the known agent roster so the
+            # per-event hot path never has to build them; unused entries
+            # are filtered out in set_final_output.
+            "agents": {
+                name: {
+                    "instructions": _AGENT_INSTRUCTIONS[name],
+                    "tools_available": _AGENT_TOOLS[name],
+                    "tool_calls": [],
+                    "output": "",
+                    "duration_ms": None,
+                }
+                for name in _AGENT_INSTRUCTIONS
+            },
             "execution_order": [],
             "handoffs": [],
             "final_output": "",
             "duration_ms": None,
         }
         self._current_agent: str | None = None
-        self._response_buffers: dict[str, list[str]] = {}
-        self._start_time = datetime.now()
-        self._agent_start_times: dict[str, datetime] = {}
-        self._seen_tool_calls: set[str] = set()  # dedupe by call_id
+        # Bounded per-agent chunk buffers: only the trailing
+        # _MAX_BUFFER_CHUNKS chunks are kept for the trace record, so
+        # memory stays O(1) per agent however long the response runs.
+        # Live display isn't affected — the runner streams tokens to
+        # stdout as they arrive.
+        self._response_buffers: dict[str, deque[bytes]] = {}
+        # Durations use perf_counter_ns — integer subtraction instead of
+        # a datetime object allocation per timing call. Wall-clock stays
+        # only in the top-level "timestamp" field.
+        self._start_ns = time.perf_counter_ns()
+        self._agent_start_ns: dict[str, int] = {}
+        self._seen_tool_calls: set[tuple[str, str]] = set()  # dedupe by (executor, call_id)
+        # Indices of tool calls still awaiting a result, per agent —
+        # results attach in O(1) instead of scanning the call list.
+        self._pending_results: dict[str, deque[int]] = defaultdict(deque)
         self.event_count = 0
 
     def _ensure_agent(self, name: str) -> None:
-        """Ensure an agent entry exists in the trace."""
+        """Ensure an agent entry exists (only hit for executors outside the known roster)."""
         if name and name not in self.trace["agents"]:
             self.trace["agents"][name] = {
                 "instructions": _AGENT_INSTRUCTIONS.get(name, ""),
@@ -150,7 +196,7 @@ class WorkflowTracer:
         if isinstance(event, ExecutorInvokedEvent):
             executor_id = event.executor_id
             self._current_agent = executor_id
-            self._agent_start_times[executor_id or "?"] = datetime.now()
+            self._agent_start_ns[executor_id or "?"] = time.perf_counter_ns()
             if executor_id:
                 self._ensure_agent(executor_id)
                 if executor_id not in self.trace["execution_order"]:
@@ -159,17 +205,17 @@ class WorkflowTracer:
         # ── Agent completed ──
         elif isinstance(event, ExecutorCompletedEvent):
             executor_id = event.executor_id
-            start = self._agent_start_times.pop(executor_id or "?", None)
-            dur = round((datetime.now() - start).total_seconds() * 1000) if start else None
+            start_ns = self._agent_start_ns.pop(executor_id or "?", None)
+            dur = (time.perf_counter_ns() - start_ns) // 1_000_000 if start_ns else None
             if executor_id and executor_id in self.trace["agents"]:
                 if dur and dur > 10:
                     self.trace["agents"][executor_id]["duration_ms"] = dur
                 # Flush buffered streaming text
                 if executor_id in self._response_buffers:
-                    text = "".join(self._response_buffers.pop(executor_id))
+                    text = b"".join(self._response_buffers.pop(executor_id)).decode("utf-8")
                     if text.strip():
                         self.trace["agents"][executor_id]["output"] = text
-            if dur and dur > 10:
+            if dur and dur > 10 and logger.isEnabledFor(logging.INFO):
                 logger.info("✓ %s completed (%sms)", executor_id, dur)
 
         # ── Handoff ──
@@ -177,7 +223,8 @@ class WorkflowTracer:
             source = getattr(event, "source", None)
             target = getattr(event, "target", None)
             self.trace["handoffs"].append({"from": str(source), "to": str(target)})
-            logger.info("🔀 Handoff: %s → %s", source, target)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("🔀 Handoff: %s → %s", source, target)
 
         # ── Agent streaming update ──
         # This is where the good stuff is: text chunks, tool calls, tool results
@@ -189,9 +236,9 @@ class WorkflowTracer:
                 # Buffer streaming text
                 text = getattr(data, "text", "") or ""
                 if text and executor_id:
-                    if executor_id not in self._response_buffers:
-                        self._response_buffers[executor_id] = []
-                    self._response_buffers[executor_id].append(text)
+                    self._response_buffers.setdefault(
+                        executor_id, deque(maxlen=_MAX_BUFFER_CHUNKS)
+                    ).append(text.encode("utf-8"))
 
                 # Scan contents for tool calls and results
                 for content in (data.contents or []):
@@ -202,7 +249,7 @@ class WorkflowTracer:
 
                     # Tool call: name is a non-empty string
                     if name and isinstance(name, str) and name.strip():
-                        dedup_key = f"{executor_id}:{call_id or name}"
+                        dedup_key = (executor_id or "", call_id or name)
                         if dedup_key not in self._seen_tool_calls:
                             self._seen_tool_calls.add(dedup_key)
                             self._ensure_agent(executor_id or "unknown")
@@ -212,27 +259,32 @@ class WorkflowTracer:
                                 "result": None,
                             }
                             if executor_id and executor_id in self.trace["agents"]:
-                                self.trace["agents"][executor_id]["tool_calls"].append(tool_entry)
-                            logger.info("🔧 %s → %s(%s)", executor_id, name, _truncate(str(arguments), 60))
-
-                    # Tool result: result is not None
+                                calls = self.trace["agents"][executor_id]["tool_calls"]
+                                calls.append(tool_entry)
+                                self._pending_results[executor_id].append(len(calls) - 1)
+                            # Guarded: the str()+_truncate of arguments is
+                            # wasted work when INFO is filtered out.
+                            if logger.isEnabledFor(logging.INFO):
+                                logger.info("🔧 %s → %s(%s)", executor_id, name, _truncate(str(arguments), 60))
+
+                    # Tool result: result is not None — attach to the oldest
+                    # pending call for this agent (results arrive in call order)
                     if result is not None and executor_id and executor_id in self.trace["agents"]:
-                        for tc in reversed(self.trace["agents"][executor_id]["tool_calls"]):
-                            if tc["result"] is None:
-                                tc["result"] = _safe_serialise(result)
+                        pending = self._pending_results[executor_id]
+                        if pending:
+                            tc = self.trace["agents"][executor_id]["tool_calls"][pending.popleft()]
+                            tc["result"] = _safe_serialise(result)
+                            if logger.isEnabledFor(logging.INFO):
                                 logger.info("   ← %s result: %s", tc["tool"], _truncate(str(result), 80))
-                                break
 
     def set_final_output(self, output: str) -> None:
         """Set the final workflow output text."""
         self.trace["final_output"] = output
-        self.trace["duration_ms"] = round(
-            (datetime.now() - self._start_time).total_seconds() * 1000
-        )
+        self.trace["duration_ms"] = (time.perf_counter_ns() - self._start_ns) // 1_000_000
         # Flush remaining buffers
-        for agent_name, chunks in self._response_buffers.items():
+        for agent_name, buf in self._response_buffers.items():
             if agent_name in self.trace["agents"] and not self.trace["agents"][agent_name]["output"]:
-                text = "".join(chunks)
+                text = b"".join(buf).decode("utf-8")
                 if text.strip():
                     self.trace["agents"][agent_name]["output"] = text
         self._response_buffers.clear()
@@ -249,55 +301,76 @@ class WorkflowTracer:
 
     def save(self, trace_dir: str = "traces") -> str:
         """Save the trace as a JSON file. Returns the file path."""
-        os.makedirs(trace_dir, exist_ok=True)
+        _ensure_dir(trace_dir)
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         mode = self.trace["mode"]
         filename = f"{trace_dir}/trace_{mode}_{ts}.json"
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(self.trace, f, indent=2, ensure_ascii=False, default=str)
+        self._write(filename)
         logger.info("📄 Trace saved: %s", filename)
         return filename
 
+    async def asave(self, trace_dir: str = "traces") -> str:
+        """
+        Async variant of save: JSON serialisation and the file write run
+        on a worker thread so workflow completion never blocks the event
+        loop — matters when several workflows finish at once.
+        """
+        _ensure_dir(trace_dir)
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        mode = self.trace["mode"]
+        filename = f"{trace_dir}/trace_{mode}_{ts}.json"
+        await asyncio.to_thread(self._write, filename)
+        logger.info("📄 Trace saved: %s", filename)
+        return filename
+
+    def _write(self, filename: str) -> None:
+        with open(filename, "w", encoding="utf-8") as f:
+            if orjson is not None:
+                f.write(orjson.dumps(self.trace, default=str, option=orjson.OPT_INDENT_2).decode())
+            else:
+                json.dump(self.trace, f, indent=2, ensure_ascii=False, default=str)
+
     def get_trace(self) -> dict[str, Any]:
         return self.trace
 
-    def print_summary(self) -> None:
-        """Print a human-readable summary to console."""
+    def print_summary(self, out=None) -> None:
+        """Print a human-readable summary to out (default: console)."""
         t = self.trace
-        print(f"\n{'─' * 60}")
-        print(f"📊 TRACE SUMMARY — {t['mode'].upper()}")
-        print(f"{'─' * 60}")
-        print(f"Input:    {t['input']}")
-        print(f"Duration: {t['duration_ms']}ms")
-        print(f"Agents:   {' → '.join(t['execution_order'])}")
+        out = out if out is not None else sys.stdout
+        print(f"\n{'─' * 60}", file=out)
+        print(f"📊 TRACE SUMMARY — {t['mode'].upper()}", file=out)
+        print(f"{'─' * 60}", file=out)
+        print(f"Input:    {t['input']}", file=out)
+        print(f"Duration: {t['duration_ms']}ms", file=out)
+        print(f"Agents:   {' → '.join(t['execution_order'])}", file=out)
         if t["handoffs"]:
             chain = " → ".join(f"{h['from']}→{h['to']}" for h in t["handoffs"])
-            print(f"Handoffs: {chain}")
-        print()
+            print(f"Handoffs: {chain}", file=out)
+        print(file=out)
 
         for name in t["execution_order"]:
             agent = t["agents"].get(name, {})
             dur = agent.get("duration_ms")
-            print(f"  🤖 {name}" + (f" ({dur}ms)" if dur else ""))
+            print(f"  🤖 {name}" + (f" ({dur}ms)" if dur else ""), file=out)
 
             instr = agent.get("instructions", "")
             if instr:
-                print(f"     📋 {_truncate(instr, 100)}")
+                print(f"     📋 {_truncate(instr, 100)}", file=out)
 
             for tc in agent.get("tool_calls", []):
                 args_preview = _truncate(str(tc["arguments"]), 50)
-                print(f"     🔧 {tc['tool']}({args_preview})")
+                print(f"     🔧 {tc['tool']}({args_preview})", file=out)
                 if tc.get("result"):
-                    print(f"        → {_truncate(str(tc['result']), 80)}")
+                    print(f"        → {_truncate(str(tc['result']), 80)}", file=out)
 
             output = agent.get("output", "")
             if output:
-                print(f"     💬 {_truncate(output, 150)}")
-            print()
+                print(f"     💬 {_truncate(output, 150)}", file=out)
+            print(file=out)
 
         if t["final_output"]:
-            print(f"Final: {_truncate(t['final_output'], 200)}")
-        print(f"{'─' * 60}\n")
+            print(f"Final: {_truncate(t['final_output'], 200)}", file=out)
+        print(f"{'─' * 60}\n", file=out)
 
     def summary(self) -> str:
         return (
@@ -310,23 +383,32 @@ class WorkflowTracer:
 # ─── Helpers ───
 
 def _safe_serialise(obj: Any) -> Any:
-    if obj is None:
-        return None
-    if isinstance(obj, (str, int, float, bool)):
+    if obj is None or isinstance(obj, (str, int, float, bool)):
         return obj
-    if isinstance(obj, dict):
-        return {k: _safe_serialise(v) for k, v in obj.items()}
-    if isinstance(obj, (list, tuple)):
-        return [_safe_serialise(v) for v in obj]
+    # Single dump/load round-trip instead of a recursive Python walk;
+    # orjson does it in C when available.
+    if orjson is not None:
+        try:
+            return orjson.loads(orjson.dumps(obj, default=str))
+        except (orjson.JSONEncodeError, TypeError):
+            return str(obj)
     try:
-        return json.loads(str(obj))
-    except (json.JSONDecodeError, TypeError):
+        return json.loads(json.dumps(obj, default=str))
+    except (TypeError, ValueError):
         return str(obj)
 
 
+_WS_TABLE = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
+
+
 def _truncate(text: str, max_len: int = 100) -> str:
-    text = text.replace("\n", " ").strip()
-    return text[:max_len] + "…" if len(text) > max_len else text
+    # Only the first max_len+1 chars can survive truncation, so slice
+    # before normalising whitespace — multi-KB tool results would
+    # otherwise be scanned in full just to throw the tail away.
+    head = text[: max_len + 1].translate(_WS_TABLE).strip()
+    if len(head) <= max_len:
+        return head
+    return head[:max_len] + "…"
 
 
 # ─── Backward compat alias ───
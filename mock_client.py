@@ -0,0 +1,80 @@
+"""
+In-process mock chat client for CI and local development.
+
+Set TRAVEL_ASSISTANT_MOCK=1 and get_chat_client() returns MockChatClient
+instead of AzureOpenAIChatClient: no network, no tokens, and the full
+demo finishes in well under a second. Responses are deterministic —
+keyword-matched against the user request and synthesized from the same
+mock data the real tools use — so the runner, tracer, and workflow
+wiring can be exercised end-to-end without Azure credentials.
+"""
+
+import asyncio
+from typing import Any
+
+from agent_framework import ChatMessage, ChatResponse, ChatResponseUpdate, TextContent
+
+from .mock_data import (
+    mock_weather, mock_packing_list, mock_activities, mock_search_flights,
+)
+from .speculative import extract_city
+
+_STREAM_CHUNK_CHARS = 40
+
+
+def _plan_response(user_text: str) -> str:
+    """Deterministic canned answer keyed on request keywords."""
+    text = user_text.lower()
+    city = extract_city(user_text) or "your destination"
+    sections = []
+
+    if "weather" in text:
+        sections.append(f"Here's the current weather:\n{mock_weather(city)}")
+    if "pack" in text or "luggage" in text:
+        sections.append(f"Suggested packing list:\n{mock_packing_list('mild and breezy')}")
+    if any(w in text for w in ("flight", "hotel", "book", "travel")):
+        sections.append(f"Flight options:\n{mock_search_flights('Dublin', city)}")
+    if any(w in text for w in ("activit", "things to do", "everything", "tips")):
+        sections.append(f"Things to do:\n{mock_activities(city)}")
+
+    if not sections:
+        sections.append(f"Happy to help plan your trip to {city}!")
+    return "\n\n".join(sections)
+
+
+class MockChatClient:
+    """
+    Duck-typed stand-in for AzureOpenAIChatClient: implements the
+    get_response / get_streaming_response surface agents call, returning
+    synthesized text instead of hitting a model.
+    """
+
+    def __init__(self, latency_s: float = 0.0) -> None:
+        # Optional artificial latency, handy when testing concurrency.
+        self.latency_s = latency_s
+
+    @staticmethod
+    def _last_user_text(messages: Any) -> str:
+        if isinstance(messages, str):
+            return messages
+        for message in reversed(list(messages or [])):
+            text = getattr(message, "text", None) or str(message)
+            if text:
+                return text
+        return ""
+
+    async def get_response(self, messages: Any = None, **kwargs: Any) -> ChatResponse:
+        if self.latency_s:
+            await asyncio.sleep(self.latency_s)
+        reply = _plan_response(self._last_user_text(messages))
+        return ChatResponse(messages=[ChatMessage(role="assistant", text=reply)])
+
+    async def get_streaming_response(self, messages: Any = None, **kwargs: Any):
+        if self.latency_s:
+            await asyncio.sleep(self.latency_s)
+        reply = _plan_response(self._last_user_text(messages))
+        for i in range(0, len(reply), _STREAM_CHUNK_CHARS):
+            yield ChatResponseUpdate(
+                role="assistant",
+                contents=[TextContent(text=reply[i:i + _STREAM_CHUNK_CHARS])],
+            )
@@ -7,23 +7,101 @@ To swap in real APIs later, replace the function bodies — signatures stay the
 
 import json
 import random
+import re
 from datetime import datetime, timedelta
 
+try:
+    import orjson  # Rust JSON encoder: 5-6x faster than stdlib on these payloads
+except ImportError:
+    orjson = None
+
+
+def _dest_hash(destination: str) -> int:
+    """Deterministic index seed for a destination name.
+
+    Summing the encoded bytes runs the loop in C; the old
+    sum(ord(c) for c in ...) iterated per character in the interpreter.
+    Case-insensitive so "paris" and "Paris" get the same mock data.
+    """
+    return sum(destination.lower().encode("utf-8"))
+
+
+def _dumps(obj, pretty: bool = False) -> str:
+    """Serialise a tool payload, via orjson when installed.
+
+    Compact by default: these payloads are read by LLMs, and indent=2
+    spends ~30% of the byte (and token) count on whitespace. Pass
+    pretty=True when a human is the consumer.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(obj, default=str, option=option).decode()
+    if pretty:
+        return json.dumps(obj, indent=2, default=str)
+    return json.dumps(obj, separators=(",", ":"), default=str)
+
+
+def _loads(data):
+    """Parse JSON from bytes or str, via orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Static tables, hoisted to module scope so the hot tool paths don't
+# rebuild identical list/dict literals on every call. Tuples rather than
+# lists: these are read-only lookup data.
+
+_WEATHER_CONDITIONS = (
+    {"temp_c": 22, "condition": "Sunny", "humidity": 45, "wind_kph": 12, "rain_chance": 5},
+    {"temp_c": 14, "condition": "Partly Cloudy", "humidity": 68, "wind_kph": 24, "rain_chance": 40},
+    {"temp_c": 8, "condition": "Overcast with Rain", "humidity": 85, "wind_kph": 35, "rain_chance": 80},
+    {"temp_c": 30, "condition": "Hot and Humid", "humidity": 78, "wind_kph": 8, "rain_chance": 15},
+    {"temp_c": -2, "condition": "Cold and Snowy", "humidity": 70, "wind_kph": 20, "rain_chance": 60},
+    {"temp_c": 18, "condition": "Mild and Breezy", "humidity": 55, "wind_kph": 18, "rain_chance": 25},
+)
+
+_FORECAST_CYCLE = ("Sunny", "Partly Cloudy", "Cloudy", "Light Rain", "Sunny", "Thunderstorms", "Clear")
+
+_AIRLINES = ("Aer Lingus", "Ryanair", "Lufthansa", "KLM", "Emirates", "British Airways")
+
+# "{destination}" placeholders are filled in per call; entries without a
+# placeholder pass through str.format unchanged.
+_ACTIVITIES_DB = {
+    "sightseeing": (
+        {"name": "Walking Tour of {destination}", "duration": "3h", "price_usd": 25, "rating": 4.7},
+        {"name": "{destination} Historical Museum", "duration": "2h", "price_usd": 15, "rating": 4.5},
+        {"name": "Panoramic City View Point", "duration": "1h", "price_usd": 0, "rating": 4.8},
+    ),
+    "food": (
+        {"name": "Local Food Tour in {destination}", "duration": "3.5h", "price_usd": 65, "rating": 4.9},
+        {"name": "Cooking Class - Local Cuisine", "duration": "4h", "price_usd": 80, "rating": 4.6},
+        {"name": "Street Food Market Visit", "duration": "2h", "price_usd": 0, "rating": 4.4},
+    ),
+    "outdoor": (
+        {"name": "Day Hike near {destination}", "duration": "5h", "price_usd": 40, "rating": 4.7},
+        {"name": "Bike Tour", "duration": "3h", "price_usd": 35, "rating": 4.5},
+        {"name": "Kayaking / Water Sports", "duration": "2h", "price_usd": 55, "rating": 4.3},
+    ),
+    "culture": (
+        {"name": "Live Music / Theatre", "duration": "2.5h", "price_usd": 45, "rating": 4.6},
+        {"name": "Art Gallery Crawl", "duration": "3h", "price_usd": 20, "rating": 4.4},
+        {"name": "Local Market & Artisan Shops", "duration": "2h", "price_usd": 0, "rating": 4.5},
+    ),
+}
+
+_HOTEL_NAME_TEMPLATES = (
+    "Grand Hotel {destination}", "The {destination} Inn", "Park View Suites",
+    "Budget Stay {destination}", "Boutique {destination} House",
+)
+
 
 # ─────────────────────────── Weather ───────────────────────────
 
 def mock_weather(destination: str) -> str:
-    conditions = [
-        {"temp_c": 22, "condition": "Sunny", "humidity": 45, "wind_kph": 12, "rain_chance": 5},
-        {"temp_c": 14, "condition": "Partly Cloudy", "humidity": 68, "wind_kph": 24, "rain_chance": 40},
-        {"temp_c": 8, "condition": "Overcast with Rain", "humidity": 85, "wind_kph": 35, "rain_chance": 80},
-        {"temp_c": 30, "condition": "Hot and Humid", "humidity": 78, "wind_kph": 8, "rain_chance": 15},
-        {"temp_c": -2, "condition": "Cold and Snowy", "humidity": 70, "wind_kph": 20, "rain_chance": 60},
-        {"temp_c": 18, "condition": "Mild and Breezy", "humidity": 55, "wind_kph": 18, "rain_chance": 25},
-    ]
-    idx = sum(ord(c) for c in destination.lower()) % len(conditions)
-    w = conditions[idx]
-    return json.dumps({
+    idx = _dest_hash(destination) % len(_WEATHER_CONDITIONS)
+    w = _WEATHER_CONDITIONS[idx]
+    return _dumps({
         "destination": destination,
         "current": {
             "temperature_c": w["temp_c"], "temperature_f": round(w["temp_c"] * 9 / 5 + 32),
@@ -31,26 +109,44 @@ def mock_weather(destination: str) -> str:
             "wind_kph": w["wind_kph"], "rain_chance_pct": w["rain_chance"],
         },
         "retrieved_at": datetime.now().isoformat(),
-    }, indent=2)
+    })
 
 
 def mock_forecast(destination: str, days: int = 5) -> str:
-    base_temp = sum(ord(c) for c in destination.lower()) % 25 + 5
-    conditions_cycle = ["Sunny", "Partly Cloudy", "Cloudy", "Light Rain", "Sunny", "Thunderstorms", "Clear"]
-    forecast_days = []
-    for i in range(days):
-        date = (datetime.now() + timedelta(days=i + 1)).strftime("%Y-%m-%d")
-        temp_var = random.randint(-3, 3)
-        forecast_days.append({
-            "date": date, "high_c": base_temp + 4 + temp_var, "low_c": base_temp - 4 + temp_var,
-            "condition": conditions_cycle[(sum(ord(c) for c in destination) + i) % len(conditions_cycle)],
-            "rain_chance_pct": random.choice([10, 20, 30, 50, 70]),
-        })
-    return json.dumps({"destination": destination, "forecast": forecast_days}, indent=2)
+    cycle_base = _dest_hash(destination)
+    base_temp = cycle_base % 25 + 5
+    # date.isoformat() hits a C fast path that strftime("%Y-%m-%d")
+    # doesn't; the random draws are batched into two choices() calls
+    # instead of one RNG round-trip per day.
+    today = datetime.now().date()
+    temp_vars = random.choices(range(-3, 4), k=days)
+    rain_chances = random.choices((10, 20, 30, 50, 70), k=days)
+    forecast_days = [
+        {
+            "date": (today + timedelta(days=i + 1)).isoformat(),
+            "high_c": base_temp + 4 + temp_vars[i], "low_c": base_temp - 4 + temp_vars[i],
+            "condition": _FORECAST_CYCLE[(cycle_base + i) % len(_FORECAST_CYCLE)],
+            "rain_chance_pct": rain_chances[i],
+        }
+        for i in range(days)
+    ]
+    return _dumps({"destination": destination, "forecast": forecast_days})
 
 
 # ─────────────────────────── Packing ───────────────────────────
 
+# One compiled scan over the weather summary instead of four separate
+# any(w in wl for w in [...]) substring sweeps. Deliberately unanchored:
+# the summary is free-text model output where "rainy"/"snowing" are as
+# common as the bare words, and the original substring checks matched
+# those inflections too.
+_PACK_PATTERN = re.compile(r"rain|cloudy|overcast|cold|snow|hot|sunny|humid|mild|breezy|partly")
+_WET_WORDS = frozenset({"rain", "cloudy", "overcast"})
+_COLD_WORDS = frozenset({"cold", "snow"})
+_HOT_WORDS = frozenset({"hot", "sunny", "humid"})
+_MILD_WORDS = frozenset({"mild", "breezy", "partly"})
+
+
 def mock_packing_list(weather_summary: str, trip_type: str = "general") -> str:
     base = {
         "essentials": ["Passport/ID", "Phone charger", "Travel adapter", "Toiletries bag", "Medications"],
@@ -58,13 +154,14 @@ def mock_packing_list(weather_summary: str, trip_type: str = "general") -> str:
         "accessories": ["Sunglasses", "Day backpack", "Reusable water bottle"],
     }
     wl = weather_summary.lower()
-    if any(w in wl for w in ["rain", "cloudy", "overcast"]):
+    hits = set(_PACK_PATTERN.findall(wl))
+    if hits & _WET_WORDS:
         base["clothing"].extend(["Waterproof jacket", "Umbrella", "Quick-dry trousers"])
-    if any(w in wl for w in ["cold", "snow", "-"]):
+    if hits & _COLD_WORDS or "-" in wl:  # "-" catches negative temperatures
         base["clothing"].extend(["Warm coat", "Thermal layers", "Gloves", "Beanie", "Scarf"])
-    if any(w in wl for w in ["hot", "sunny", "humid"]):
+    if hits & _HOT_WORDS:
         base["clothing"].extend(["Light breathable shirts", "Shorts", "Sun hat", "Sunscreen SPF50"])
-    if any(w in wl for w in ["mild", "breezy", "partly"]):
+    if hits & _MILD_WORDS:
         base["clothing"].extend(["Light jacket", "Layers", "Long-sleeve shirts"])
     extras = {
         "business": ["Formal shirt/blouse", "Dress shoes", "Laptop + charger", "Blazer"],
@@ -74,102 +171,120 @@ def mock_packing_list(weather_summary: str, trip_type: str = "general") -> str:
         "general": ["Versatile outfit layers", "Comfortable shoes", "Camera"],
     }
     base["trip_specific"] = extras.get(trip_type.lower(), extras["general"])
-    return json.dumps({"packing_list": base, "trip_type": trip_type, "total_items": sum(len(v) for v in base.values())}, indent=2)
+    return _dumps({"packing_list": base, "trip_type": trip_type, "total_items": sum(len(v) for v in base.values())})
+
+
+# Payloads whose structure never varies are serialised once at import;
+# per call only the dynamic fields are spliced into the frozen template.
+
+def _json_escape(s: str) -> str:
+    """Escape a string for splicing inside JSON double quotes."""
+    return json.dumps(s)[1:-1]
+
+
+_LUGGAGE_TEMPLATE = _dumps({
+    "airline": "__AIRLINE__",
+    "carry_on": {"max_weight_kg": 7, "max_dimensions_cm": "55 x 40 x 20"},
+    "checked": {"max_weight_kg": 23, "max_dimensions_cm": "158 linear cm", "free_bags": 1},
+    "prohibited_items": ["Liquids over 100ml in carry-on", "Sharp objects in carry-on", "Lithium batteries in checked luggage"],
+    "tips": ["Pack liquids in a clear resealable bag", "Wear heaviest shoes on the plane", "Roll clothes to save space"],
+})
 
 
 def mock_luggage_restrictions(airline: str = "general") -> str:
-    return json.dumps({
-        "airline": airline,
-        "carry_on": {"max_weight_kg": 7, "max_dimensions_cm": "55 x 40 x 20"},
-        "checked": {"max_weight_kg": 23, "max_dimensions_cm": "158 linear cm", "free_bags": 1},
-        "prohibited_items": ["Liquids over 100ml in carry-on", "Sharp objects in carry-on", "Lithium batteries in checked luggage"],
-        "tips": ["Pack liquids in a clear resealable bag", "Wear heaviest shoes on the plane", "Roll clothes to save space"],
-    }, indent=2)
+    return _LUGGAGE_TEMPLATE.replace("__AIRLINE__", _json_escape(airline))
 
 
 # ─────────────────────────── Activities ───────────────────────────
 
 def mock_activities(destination: str, category: str = "all") -> str:
-    db = {
-        "sightseeing": [
-            {"name": f"Walking Tour of {destination}", "duration": "3h", "price_usd": 25, "rating": 4.7},
-            {"name": f"{destination} Historical Museum", "duration": "2h", "price_usd": 15, "rating": 4.5},
-            {"name": "Panoramic City View Point", "duration": "1h", "price_usd": 0, "rating": 4.8},
-        ],
-        "food": [
-            {"name": f"Local Food Tour in {destination}", "duration": "3.5h", "price_usd": 65, "rating": 4.9},
-            {"name": "Cooking Class - Local Cuisine", "duration": "4h", "price_usd": 80, "rating": 4.6},
-            {"name": "Street Food Market Visit", "duration": "2h", "price_usd": 0, "rating": 4.4},
-        ],
-        "outdoor": [
-            {"name": f"Day Hike near {destination}", "duration": "5h", "price_usd": 40, "rating": 4.7},
-            {"name": "Bike Tour", "duration": "3h", "price_usd": 35, "rating": 4.5},
-            {"name": "Kayaking / Water Sports", "duration": "2h", "price_usd": 55, "rating": 4.3},
-        ],
-        "culture": [
-            {"name": "Live Music / Theatre", "duration": "2.5h", "price_usd": 45, "rating": 4.6},
-            {"name": "Art Gallery Crawl", "duration": "3h", "price_usd": 20, "rating": 4.4},
-            {"name": "Local Market & Artisan Shops", "duration": "2h", "price_usd": 0, "rating": 4.5},
-        ],
-    }
-    selected = db if category.lower() == "all" else {category: db.get(category.lower(), db["sightseeing"])}
-    return json.dumps({"destination": destination, "activities": selected, "total_options": sum(len(v) for v in selected.values())}, indent=2)
+    def render(items):
+        return [{**a, "name": a["name"].format(destination=destination)} for a in items]
+
+    if category.lower() == "all":
+        selected = {cat: render(items) for cat, items in _ACTIVITIES_DB.items()}
+    else:
+        items = _ACTIVITIES_DB.get(category.lower(), _ACTIVITIES_DB["sightseeing"])
+        selected = {category: render(items)}
+    return _dumps({"destination": destination, "activities": selected, "total_options": sum(len(v) for v in selected.values())})
+
+
+_LOCAL_TIPS_TEMPLATE = _dumps({
+    "destination": "__DESTINATION__",
+    "tips": {
+        "currency": "Check XE.com for current rates",
+        "language_basics": ["Hello", "Thank you", "Excuse me", "How much?"],
+        "tipping": "10-15% at restaurants is standard in most countries",
+        "safety": "Generally safe for tourists. Keep valuables secure in crowded areas.",
+        "transport": "Public transport in __DESTINATION__ is recommended. Consider a day pass.",
+    },
+})
 
 
 def mock_local_tips(destination: str) -> str:
-    return json.dumps({
-        "destination": destination,
-        "tips": {
-            "currency": "Check XE.com for current rates",
-            "language_basics": ["Hello", "Thank you", "Excuse me", "How much?"],
-            "tipping": "10-15% at restaurants is standard in most countries",
-            "safety": f"Generally safe for tourists. Keep valuables secure in crowded areas.",
-            "transport": f"Public transport in {destination} is recommended. Consider a day pass.",
-        },
-    }, indent=2)
+    return _LOCAL_TIPS_TEMPLATE.replace("__DESTINATION__", _json_escape(destination))
 
 
 # ─────────────────────────── Flights & Hotels ───────────────────────────
 
 def mock_search_flights(origin: str, destination: str, date: str = "2025-03-01") -> str:
-    airlines = ["Aer Lingus", "Ryanair", "Lufthansa", "KLM", "Emirates", "British Airways"]
-    base_price = (sum(ord(c) for c in destination) % 400) + 150
+    dest_sum = _dest_hash(destination)
+    base_price = (dest_sum % 400) + 150
+    dur = 2 + (dest_sum % 10)
+    price_jitter = random.choices(range(-20, 41), k=4)
+    seats = random.choices(range(2, 46), k=4)
     flights = []
     for i in range(4):
-        airline = airlines[(sum(ord(c) for c in destination) + i) % len(airlines)]
+        airline = _AIRLINES[(dest_sum + i) % len(_AIRLINES)]
         dep_h = 6 + (i * 4)
-        dur = 2 + (sum(ord(c) for c in destination) % 10)
         stops = 0 if i < 2 else 1
         flights.append({
             "flight_id": f"FL-{1000 + i}", "airline": airline,
             "departure": f"{date}T{dep_h:02d}:{'00' if i % 2 == 0 else '30'}:00",
             "duration_hours": dur + (0.5 if stops else 0), "stops": stops,
-            "price_eur": base_price + (i * 45) + random.randint(-20, 40),
-            "cabin_class": "Economy", "seats_remaining": random.randint(2, 45),
+            "price_eur": base_price + (i * 45) + price_jitter[i],
+            "cabin_class": "Economy", "seats_remaining": seats[i],
         })
-    return json.dumps({"origin": origin, "destination": destination, "date": date, "flights": flights}, indent=2)
+    return _dumps({"origin": origin, "destination": destination, "date": date, "flights": flights})
 
 
 def mock_search_hotels(destination: str, checkin: str = "2025-03-01", nights: int = 3) -> str:
-    names = [f"Grand Hotel {destination}", f"The {destination} Inn", "Park View Suites", f"Budget Stay {destination}", f"Boutique {destination} House"]
-    base_price = (sum(ord(c) for c in destination) % 80) + 60
+    names = [t.format(destination=destination) for t in _HOTEL_NAME_TEMPLATES]
+    base_price = (_dest_hash(destination) % 80) + 60
+    price_jitter = random.choices(range(-10, 21), k=len(names))
+    rooms = random.choices(range(1, 13), k=len(names))
     hotels = []
     for i, name in enumerate(names):
-        price = base_price + (i * 30) + random.randint(-10, 20)
+        price = base_price + (i * 30) + price_jitter[i]
         stars = min(5, 2 + i)
         hotels.append({
             "hotel_id": f"HTL-{2000 + i}", "name": name, "stars": stars,
             "price_per_night_eur": price, "total_eur": price * nights,
             "rating": round(3.5 + (stars * 0.25) + random.uniform(-0.2, 0.3), 1),
             "amenities": ["WiFi", "Breakfast"] + (["Pool", "Gym"] if stars >= 4 else []),
-            "rooms_available": random.randint(1, 12),
+            "rooms_available": rooms[i],
         })
-    return json.dumps({"destination": destination, "checkin": checkin, "nights": nights, "hotels": hotels}, indent=2)
+    return _dumps({"destination": destination, "checkin": checkin, "nights": nights, "hotels": hotels})
+
+
+_BOOK_FLIGHT_TEMPLATE = _dumps({"status": "confirmed", "booking_ref": "BK-__REF__", "flight_id": "__ID__", "passenger": "__NAME__"})
+_BOOK_HOTEL_TEMPLATE = _dumps({"status": "confirmed", "booking_ref": "HBK-__REF__", "hotel_id": "__ID__", "guest": "__NAME__", "nights": "__NIGHTS__"})
 
 
 def mock_book_flight(flight_id: str, passenger_name: str) -> str:
-    return json.dumps({"status": "confirmed", "booking_ref": f"BK-{random.randint(100000,999999)}", "flight_id": flight_id, "passenger": passenger_name}, indent=2)
+    return (
+        _BOOK_FLIGHT_TEMPLATE
+        .replace("__REF__", str(random.randint(100000, 999999)))
+        .replace("__ID__", _json_escape(flight_id))
+        .replace("__NAME__", _json_escape(passenger_name))
+    )
 
 
 def mock_book_hotel(hotel_id: str, guest_name: str, nights: int = 3) -> str:
-    return json.dumps({"status": "confirmed", "booking_ref": f"HBK-{random.randint(100000,999999)}", "hotel_id": hotel_id, "guest": guest_name, "nights": nights}, indent=2)
\ No newline at end of file
+    return (
+        _BOOK_HOTEL_TEMPLATE
+        .replace("__REF__", str(random.randint(100000, 999999)))
+        .replace("__ID__", _json_escape(hotel_id))
+        .replace("__NAME__", _json_escape(guest_name))
+        .replace('"__NIGHTS__"', str(nights))  # quoted placeholder → bare number
+    )
\ No newline at end of file
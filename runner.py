@@ -10,10 +10,15 @@ All workflows produce structured JSON traces for evaluator consumption.
 """
 
 import os
+import sys
 import asyncio
+import importlib.util
 import logging
+from functools import lru_cache
 from typing import Any, cast
 
+import httpx
+
 from agent_framework import (
     AgentResponseUpdate,
     ChatMessage,
@@ -23,18 +28,57 @@ from agent_framework.azure import AzureOpenAIChatClient
 from azure.identity import AzureCliCredential
 from dotenv import load_dotenv
 
+from .agents.definitions import create_codeact_travel_agent, execute_code_block, extract_code_block
 from .workflows import build_handoff_workflow, build_concurrent_workflow, build_sequential_workflow
+from .workflows.sequential import warm_packing_prefix
 from .logger import WorkflowTracer, setup_logging
+from .speculative import speculative_tools
 
 load_dotenv()
 
 
-def get_chat_client() -> AzureOpenAIChatClient:
+@lru_cache(maxsize=1)
+def _get_http_client() -> httpx.AsyncClient:
+    """
+    One pooled HTTP client behind every Azure OpenAI call.
+
+    Without this each underlying OpenAI client spins up its own
+    connection pool, so a multi-agent request pays TLS handshakes
+    (~50-150 ms each) per agent on cold start. A shared pool amortises
+    them, and HTTP/2 (when the h2 extra is installed) multiplexes the
+    concurrent fan-out calls over one connection.
     """
-    Create an AzureOpenAIChatClient from environment variables.
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        timeout=30.0,
+        http2=importlib.util.find_spec("h2") is not None,
+    )
+
+
+async def aclose_chat_client() -> None:
+    """Teardown hook: close the shared HTTP pool (e.g. at server shutdown)."""
+    if _get_http_client.cache_info().currsize:
+        await _get_http_client().aclose()
+        _get_http_client.cache_clear()
+    get_chat_client.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def get_chat_client() -> Any:
+    """
+    Create (once) the shared chat client from environment variables.
 
     Supports API key auth (AZURE_OPENAI_API_KEY) or Azure CLI credential (az login).
+    With TRAVEL_ASSISTANT_MOCK=1 this returns the in-process MockChatClient
+    instead — no network or tokens, for CI and local development.
+    The client is cached so every agent and workflow shares one instance —
+    and therefore one HTTP connection pool — instead of paying a fresh
+    TCP+TLS handshake per workflow.
     """
+    if os.getenv("TRAVEL_ASSISTANT_MOCK"):
+        from .mock_client import MockChatClient
+        return MockChatClient()
+
     endpoint = os.getenv("AZURE_OPENAI_ENDPOINT", "")
     api_key = os.getenv("AZURE_OPENAI_API_KEY", "")
     deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT", "gpt-4o-mini")
@@ -44,38 +88,115 @@ def get_chat_client() -> AzureOpenAIChatClient:
             api_key=api_key,
             endpoint=endpoint,
             deployment_name=deployment,
+            http_client=_get_http_client(),
         )
     else:
         return AzureOpenAIChatClient(
             credential=AzureCliCredential(),
             endpoint=endpoint,
             deployment_name=deployment,
+            http_client=_get_http_client(),
         )
 
 
+# Strong refs to fire-and-forget tasks so the event loop can't GC them
+# mid-flight; each removes itself on completion.
+_background_tasks: set[asyncio.Task] = set()
+
+
+class _StreamState:
+    """Mutable state threaded through the stream-loop event handlers."""
+
+    __slots__ = ("last_response_id", "final_output", "_chunks", "_pending", "_out")
+
+    _FLUSH_AT = 64  # chars buffered before the target is touched
+
+    def __init__(self, out: Any = None) -> None:
+        self.last_response_id: str | None = None
+        self.final_output = ""
+        self._chunks: list[str] = []
+        self._pending = 0
+        self._out = out if out is not None else sys.stdout
+
+    def write(self, text: str) -> None:
+        # Token deltas arrive a few characters at a time; printing each one
+        # with flush=True is a syscall per token. Buffer and flush in chunks.
+        self._chunks.append(text)
+        self._pending += len(text)
+        if self._pending >= self._FLUSH_AT:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._chunks:
+            print("".join(self._chunks), end="", flush=True, file=self._out)
+            self._chunks.clear()
+            self._pending = 0
+
+
+def _handle_agent_update(data: AgentResponseUpdate, state: _StreamState) -> None:
+    rid = data.response_id
+    if rid != state.last_response_id:
+        if state.last_response_id is not None:
+            state.write("\n")
+        author = data.author_name or "agent"
+        state.write(f"\n🤖 [{author}]: ")
+        state.last_response_id = rid
+    state.write(data.text)
+
+
+def _handle_message_list(data: list, state: _StreamState) -> None:
+    messages = cast(list[ChatMessage], data)
+    state.final_output = "\n\n".join(
+        f"[{m.author_name or m.role}]: {m.text}" for m in messages if m.text
+    )
+
+
+def _handle_str(data: str, state: _StreamState) -> None:
+    state.final_output = data
+
+
+# type(data) → handler: one hash lookup per event instead of a chain of
+# isinstance checks, which matters at one event per streamed token.
+_STREAM_DISPATCH = {
+    AgentResponseUpdate: _handle_agent_update,
+    list: _handle_message_list,
+    str: _handle_str,
+}
+
+
 async def run_workflow(
     user_request: str,
     mode: str = "handoff",
     stream: bool = True,
     log_file: str | None = None,
     trace_dir: str = "travel_assistant/log/traces",
+    client: AzureOpenAIChatClient | None = None,
+    out: Any = None,
 ) -> dict[str, Any]:
     """
     Run a travel assistant workflow with structured tracing.
 
     Args:
         user_request: The user's travel question.
-        mode: Workflow pattern — "handoff", "concurrent", or "sequential".
+        mode: Workflow pattern — "handoff", "concurrent", "sequential", or "codeact".
         stream: If True, print agent responses as they stream.
         log_file: Optional path for log file.
         trace_dir: Directory to save JSON traces.
+        client: Optional pre-built chat client; defaults to the shared one.
+        out: Writable text target for streamed output and the summary;
+            defaults to stdout. Concurrent callers pass their own buffer
+            here — never swap sys.stdout across awaits.
 
     Returns:
         The full trace dict (also saved to trace_dir as JSON).
     """
     setup_logging(level=logging.INFO, log_file=log_file)
 
-    chat_client = get_chat_client()
+    chat_client = client or get_chat_client()
+
+    # CodeAct runs a single agent directly — no workflow graph needed.
+    if mode == "codeact":
+        return await _run_codeact(user_request, chat_client, stream, trace_dir, out)
 
     # Build the requested workflow
     if mode == "handoff":
@@ -85,47 +206,89 @@ async def run_workflow(
     elif mode == "sequential":
         workflow = build_sequential_workflow(chat_client)
     else:
-        raise ValueError(f"Unknown mode: {mode}. Choose 'handoff', 'concurrent', or 'sequential'.")
+        raise ValueError(
+            f"Unknown mode: {mode}. Choose 'handoff', 'concurrent', 'sequential', or 'codeact'."
+        )
 
     # Set up tracer
     tracer = WorkflowTracer(user_input=user_request, mode=mode)
 
+    # Launch likely tool calls before any model turn completes — a
+    # "weather in Tokyo" request starts its get_weather lookup now,
+    # overlapping the triage/specialist thinking time. The returned keys
+    # scope the cleanup to this run: concurrent runs share the executor.
+    spec_keys = speculative_tools.prefetch(user_request)
+
+    # Sequential runs packing strictly after weather; warm packing's
+    # static prompt prefix concurrently so its prefill is served from
+    # the prompt cache by the time the weather answer lands.
+    if mode == "sequential":
+        warmup = asyncio.create_task(warm_packing_prefix(chat_client))
+        _background_tasks.add(warmup)
+        warmup.add_done_callback(_background_tasks.discard)
+
     # Run with streaming
-    final_output = ""
-    last_response_id: str | None = None
-
-    async for event in workflow.run_stream(user_request):
-        tracer.capture(event)
-
-        if stream and isinstance(event, WorkflowOutputEvent):
-            data = event.data
-            if isinstance(data, AgentResponseUpdate):
-                rid = data.response_id
-                if rid != last_response_id:
-                    if last_response_id is not None:
-                        print()
-                    author = data.author_name or "agent"
-                    print(f"\n🤖 [{author}]: ", end="", flush=True)
-                    last_response_id = rid
-                print(data.text, end="", flush=True)
-
-            elif isinstance(data, list):
-                messages = cast(list[ChatMessage], data)
-                final_output = "\n\n".join(
-                    f"[{m.author_name or m.role}]: {m.text}" for m in messages if m.text
-                )
-
-            elif isinstance(data, str):
-                final_output = data
+    state = _StreamState(out)
+
+    try:
+        async for event in workflow.run_stream(user_request):
+            tracer.capture(event)
+
+            if stream and isinstance(event, WorkflowOutputEvent):
+                handler = _STREAM_DISPATCH.get(type(event.data))
+                if handler is not None:
+                    handler(event.data, state)
+    finally:
+        state.flush()
+        speculative_tools.discard_unused(spec_keys)
 
     if stream:
-        print("\n")
+        print("\n", file=out if out is not None else sys.stdout)
 
     # Finalise trace
-    tracer.set_final_output(final_output)
-    tracer.save(trace_dir)
-    tracer.print_summary()
+    tracer.set_final_output(state.final_output)
+    await tracer.asave(trace_dir)
+    tracer.print_summary(out)
+
+    logging.getLogger("travel_assistant").info(tracer.summary())
+
+    return tracer.get_trace()
 
+
+async def _run_codeact(
+    user_request: str,
+    chat_client: AzureOpenAIChatClient,
+    stream: bool,
+    trace_dir: str,
+    out: Any = None,
+) -> dict[str, Any]:
+    """
+    Run the CodeAct agent: one model turn emits a Python block that calls
+    the tools directly, and executing it in-process produces the answer.
+    """
+    tracer = WorkflowTracer(user_input=user_request, mode="codeact")
+    agent = create_codeact_travel_agent(chat_client)
+
+    response = await agent.run(user_request)
+    response_text = response.text or ""
+
+    code = extract_code_block(response_text)
+    if code is not None:
+        try:
+            final_output = execute_code_block(code)
+        except Exception as e:
+            logging.getLogger("travel_assistant").warning("CodeAct execution failed: %s", e)
+            final_output = response_text
+    else:
+        # The model answered directly without a code block.
+        final_output = response_text
+
+    if stream:
+        print(f"\n🤖 [codeact_travel_agent]: {final_output}\n", file=out if out is not None else sys.stdout)
+
+    tracer.set_final_output(final_output)
+    await tracer.asave(trace_dir)
+    tracer.print_summary(out)
     logging.getLogger("travel_assistant").info(tracer.summary())
 
     return tracer.get_trace()
@@ -0,0 +1,130 @@
+"""
+Speculative tool prefetch.
+
+The handoff path is strictly serial: the triage model thinks (~1-2s),
+emits a handoff, the specialist model thinks, and only then does the tool
+run. For the very common "weather in <city>" pattern the eventual
+get_weather call is predictable from the raw user input, so the runner
+kicks it off on a worker thread the moment the workflow starts. When the
+agent actually calls the tool, the wrapper collects the already-running
+(or finished) future instead of starting the API call from scratch.
+
+Wrong guesses are harmless: unconsumed futures are discarded after the
+workflow completes and only cost one throwaway lookup.
+"""
+
+import logging
+import os
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+logger = logging.getLogger("travel_assistant")
+
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="speculative")
+
+# Matches "weather in Tokyo", "travelling to Galway, Ireland",
+# "trip to Bali?" — a capitalised place name after a travel phrase.
+_CITY_RE = re.compile(
+    r"(?:weather(?:\s+like)?\s+(?:in|at|for)|travell?ing\s+to|trip\s+to|visit(?:ing)?|pack\s+for(?:\s+\w+){0,3}?\s+to)"
+    r"\s+([A-Z][\w'-]*(?:,?\s[A-Z][\w'-]*)*)"
+)
+
+
+def extract_city(user_input: str) -> str | None:
+    """Best-effort destination guess from a raw user request."""
+    match = _CITY_RE.search(user_input)
+    return match.group(1).rstrip("?.!, ") if match else None
+
+
+class SpeculativeToolExecutor:
+    """
+    Launches likely tool calls ahead of the agent and hands the results
+    back when (if) the real call arrives. Futures are keyed by tool name
+    plus case-normalised arguments.
+    """
+
+    def __init__(self) -> None:
+        self._futures: dict[tuple, Future] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(tool_name: str, args: tuple) -> tuple:
+        return (tool_name,) + tuple(
+            a.strip().lower() if isinstance(a, str) else a for a in args
+        )
+
+    def submit(self, tool_name: str, args: tuple, fn, *call_args) -> bool:
+        """Start fn(*call_args) on a worker thread, keyed as tool_name(args).
+
+        Returns True if this call launched the future; False when an
+        identical speculation is already in flight (which then belongs
+        to the run that launched it).
+        """
+        key = self._key(tool_name, args)
+        with self._lock:
+            if key in self._futures:
+                return False
+            self._futures[key] = _EXECUTOR.submit(fn, *call_args)
+        logger.info("🔮 Speculative %s%s launched", tool_name, args)
+        return True
+
+    def take(self, tool_name: str, args: tuple) -> str | None:
+        """
+        Collect a speculated result for a real tool call, or None if no
+        matching speculation exists. Blocks only for a still-running
+        future — which had a head start on the model's thinking time.
+        """
+        with self._lock:
+            future = self._futures.pop(self._key(tool_name, args), None)
+        if future is None:
+            return None
+        try:
+            result = future.result()
+            logger.info("🔮 Speculative %s%s hit", tool_name, args)
+            return result
+        except Exception as e:
+            logger.warning("Speculative %s%s failed: %s", tool_name, args, e)
+            return None
+
+    def prefetch(self, user_input: str) -> list[tuple]:
+        """Guess likely tool calls from the raw user input and launch them.
+
+        Returns the keys this call launched, so the owning workflow run
+        can later discard exactly its own leftovers — runs share one
+        executor, and a finished run sweeping the whole table would
+        defeat the prefetches of runs still in flight.
+        """
+        launched: list[tuple] = []
+        city = extract_city(user_input)
+        if city and re.search(r"\bweather\b", user_input, re.IGNORECASE):
+            # Mock mode guarantees no network (CI runs rely on it), so
+            # the speculation must target the mock backend there too —
+            # live_weather geocodes over HTTP before anything else.
+            if os.getenv("TRAVEL_ASSISTANT_MOCK"):
+                from .mock_data import mock_weather
+                submitted = self.submit("get_weather", (city,), mock_weather, city)
+            else:
+                # Route through the TTL cache so even a guess nobody
+                # consumes warms it for the real tool call. Imported
+                # lazily — definitions imports this module at its top.
+                from .agents.definitions import _weather_cache
+                from .weather_api import live_weather
+                submitted = self.submit(
+                    "get_weather", (city,), _weather_cache.get_or_call, live_weather, city
+                )
+            if submitted:
+                launched.append(self._key("get_weather", (city,)))
+        return launched
+
+    def discard_unused(self, keys: list[tuple]) -> None:
+        """Drop one run's unconsumed speculations (keys from its prefetch)."""
+        with self._lock:
+            for key in keys:
+                future = self._futures.pop(key, None)
+                if future is not None:
+                    future.cancel()
+
+
+# Shared instance used by the runner and the tool wrappers.
+speculative_tools = SpeculativeToolExecutor()
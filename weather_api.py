@@ -10,10 +10,12 @@ same JSON return format — so agents and tools don't need any changes.
 Requires: pip install requests
 """
 
-import json
 import logging
 import requests
 from datetime import datetime
+from itertools import islice, zip_longest
+
+from .mock_data import _dumps, _loads
 
 logger = logging.getLogger("travel_assistant")
 
@@ -21,6 +23,14 @@ _GEOCODE_URL = "https://geocoding-api.open-meteo.com/v1/search"
 _FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
 _TIMEOUT = 8  # seconds
 
+# One shared session for all Open-Meteo traffic: keep-alive skips the
+# TCP+TLS handshake (~1-2 RTTs) on every call after the first.
+_SESSION = requests.Session()
+_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=20))
+# Explicit rather than relying on urllib3's default — a 16-day forecast
+# is ~5-10 KB of JSON and gzips to a fraction of that.
+_SESSION.headers.update({"Accept-Encoding": "gzip, deflate"})
+
 
 # ─── WMO weather code → human-readable condition ───
 
@@ -39,17 +49,25 @@ _WMO_CODES = {
     95: "Thunderstorm", 96: "Thunderstorm with slight hail", 99: "Thunderstorm with heavy hail",
 }
 
+# Dense 0-99 table derived from the sparse dict at import: per-day code
+# lookup becomes a tuple index instead of an int hash + dict probe.
+_WMO_LOOKUP = tuple(_WMO_CODES.get(code, "Unknown") for code in range(100))
+
+
+def _wmo_condition(code: int) -> str:
+    return _WMO_LOOKUP[code] if 0 <= code <= 99 else "Unknown"
+
 
 def _geocode(destination: str) -> tuple[float, float, str] | None:
     """Resolve a place name to (latitude, longitude, resolved_name) via Open-Meteo Geocoding."""
     try:
-        resp = requests.get(
+        resp = _SESSION.get(
             _GEOCODE_URL,
             params={"name": destination, "count": 1, "language": "en", "format": "json"},
             timeout=_TIMEOUT,
         )
         resp.raise_for_status()
-        results = resp.json().get("results", [])
+        results = _loads(resp.content).get("results", [])
         if results:
             r = results[0]
             name = r.get("name", destination)
@@ -61,23 +79,44 @@ def _geocode(destination: str) -> tuple[float, float, str] | None:
     return None
 
 
+# Coordinates never change, so geocode hits are cached for the process
+# lifetime keyed on the normalised name — live_weather and live_forecast
+# each call _geocode, so even a single workflow saves a round-trip.
+# Failures are deliberately not cached so transient errors can retry.
+_geocode_cache: dict[str, tuple[float, float, str]] = {}
+_GEOCODE_CACHE_MAX = 512
+
+
+def _geocode_cached(destination: str) -> tuple[float, float, str] | None:
+    key = destination.strip().lower()
+    hit = _geocode_cache.get(key)
+    if hit is None:
+        hit = _geocode(destination)
+        if hit is not None:
+            if len(_geocode_cache) >= _GEOCODE_CACHE_MAX:
+                _geocode_cache.pop(next(iter(_geocode_cache)))
+            _geocode_cache[key] = hit
+    return hit
+
+
+# Rain-chance estimate per WMO code band, flattened into a 0-99 lookup
+# table at import so the per-day hot loop is a single index instead of
+# an eight-branch if-ladder.
+_RAIN_CHANCE_BANDS = (
+    (3, 5), (48, 20), (57, 50), (67, 75),   # clear, fog, drizzle, rain
+    (77, 60), (82, 80), (86, 65), (99, 90),  # snow, rain showers, snow showers, thunderstorm
+)
+_RAIN_CHANCE = tuple(
+    next(chance for upper, chance in _RAIN_CHANCE_BANDS if code <= upper)
+    for code in range(100)
+)
+
+
 def _estimate_rain_chance(weather_code: int) -> int:
     """Rough rain chance estimate from WMO weather code."""
-    if weather_code <= 3:
-        return 5
-    if weather_code <= 48:
-        return 20  # fog
-    if weather_code <= 57:
-        return 50  # drizzle
-    if weather_code <= 67:
-        return 75  # rain
-    if weather_code <= 77:
-        return 60  # snow
-    if weather_code <= 82:
-        return 80  # rain showers
-    if weather_code <= 86:
-        return 65  # snow showers
-    return 90  # thunderstorm
+    if 0 <= weather_code <= 99:
+        return _RAIN_CHANCE[weather_code]
+    return 90  # out-of-spec code: treat like the severe end of the scale
 
 
 # ─── Public API (same signatures as mock_data.py) ───
@@ -88,7 +127,7 @@ def live_weather(destination: str) -> str:
     Returns JSON string matching the mock_weather format.
     Falls back to mock on failure.
     """
-    geo = _geocode(destination)
+    geo = _geocode_cached(destination)
     if not geo:
         logger.info("Geocode miss — falling back to mock for '%s'", destination)
         from .mock_data import mock_weather
@@ -97,7 +136,7 @@ def live_weather(destination: str) -> str:
     lat, lon, label = geo
 
     try:
-        resp = requests.get(
+        resp = _SESSION.get(
             _FORECAST_URL,
             params={
                 "latitude": lat,
@@ -108,17 +147,17 @@ def live_weather(destination: str) -> str:
             timeout=_TIMEOUT,
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = _loads(resp.content)
         current = data.get("current", {})
 
         temp_c = current.get("temperature_2m", 0)
         weather_code = current.get("weather_code", 0)
-        condition = _WMO_CODES.get(weather_code, "Unknown")
+        condition = _wmo_condition(weather_code)
         humidity = current.get("relative_humidity_2m", 0)
         wind_kph = current.get("wind_speed_10m", 0)
         rain_chance = _estimate_rain_chance(weather_code)
 
-        return json.dumps({
+        return _dumps({
             "destination": label,
             "current": {
                 "temperature_c": temp_c,
@@ -130,7 +169,7 @@ def live_weather(destination: str) -> str:
             },
             "source": "open-meteo.com",
             "retrieved_at": datetime.now().isoformat(),
-        }, indent=2)
+        })
 
     except Exception as e:
         logger.warning("Open-Meteo current weather failed: %s — falling back to mock", e)
@@ -144,7 +183,7 @@ def live_forecast(destination: str, days: int = 5) -> str:
     Returns JSON string matching the mock_forecast format.
     Falls back to mock on failure.
     """
-    geo = _geocode(destination)
+    geo = _geocode_cached(destination)
     if not geo:
         logger.info("Geocode miss — falling back to mock for '%s'", destination)
         from .mock_data import mock_forecast
@@ -153,7 +192,7 @@ def live_forecast(destination: str, days: int = 5) -> str:
     lat, lon, label = geo
 
     try:
-        resp = requests.get(
+        resp = _SESSION.get(
             _FORECAST_URL,
             params={
                 "latitude": lat,
@@ -165,7 +204,7 @@ def live_forecast(destination: str, days: int = 5) -> str:
             timeout=_TIMEOUT,
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = _loads(resp.content)
         daily = data.get("daily", {})
 
         dates = daily.get("time", [])
@@ -174,23 +213,28 @@ def live_forecast(destination: str, days: int = 5) -> str:
         codes = daily.get("weather_code", [])
         rain_probs = daily.get("precipitation_probability_max", [])
 
-        forecast_days = []
-        for i in range(min(len(dates), days)):
-            code = codes[i] if i < len(codes) else 0
-            rain = rain_probs[i] if i < len(rain_probs) else _estimate_rain_chance(code)
-            forecast_days.append({
-                "date": dates[i],
-                "high_c": highs[i] if i < len(highs) else None,
-                "low_c": lows[i] if i < len(lows) else None,
-                "condition": _WMO_CODES.get(code, "Unknown"),
-                "rain_chance_pct": rain,
-            })
-
-        return json.dumps({
+        # Single pass over the parallel arrays instead of indexing each
+        # one per day with bounds checks; zip_longest pads the shorter
+        # arrays with None just like the old i < len(...) guards did.
+        forecast_days = [
+            {
+                "date": date,
+                "high_c": high,
+                "low_c": low,
+                "condition": _wmo_condition(code if code is not None else 0),
+                "rain_chance_pct": rain if rain is not None else _estimate_rain_chance(code if code is not None else 0),
+            }
+            for date, high, low, code, rain in islice(
+                zip_longest(dates, highs, lows, codes, rain_probs), days
+            )
+            if date is not None
+        ]
+
+        return _dumps({
             "destination": label,
             "forecast": forecast_days,
             "source": "open-meteo.com",
-        }, indent=2)
+        })
 
     except Exception as e:
         logger.warning("Open-Meteo forecast failed: %s — falling back to mock", e)
@@ -1,10 +1,14 @@
 """Travel assistant workflow definitions."""
 from .handoff import build_handoff_workflow
 from .concurrent import build_concurrent_workflow
+from .concurrent_batched import build_batched_concurrent_workflow
 from .sequential import build_sequential_workflow
+from .batch import run_workflow_batch
 
 __all__ = [
+    "run_workflow_batch",
     "build_handoff_workflow",
     "build_concurrent_workflow",
+    "build_batched_concurrent_workflow",
     "build_sequential_workflow",
 ]
\ No newline at end of file
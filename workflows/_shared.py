@@ -0,0 +1,42 @@
+"""
+Shared helpers for workflow construction.
+
+Agent instances are stateless factories bound to a chat client, so
+rebuilding them for every workflow construction (e.g. one per request in
+a server) just re-allocates identical objects and re-registers the same
+tools. The cache here hands back the existing instance for a given
+(client, agent-name) pair.
+"""
+
+from typing import Any, Callable
+
+# Keyed on id(chat_client) rather than the client itself — chat clients
+# aren't guaranteed hashable. The client is also cached for the process
+# lifetime (runner.get_chat_client), so id reuse isn't a concern.
+_agent_cache: dict[tuple[int, str], Any] = {}
+
+
+def _get_or_create(chat_client: Any, agent_name: str, factory: Callable[[Any], Any]) -> Any:
+    key = (id(chat_client), agent_name)
+    agent = _agent_cache.get(key)
+    if agent is None:
+        agent = factory(chat_client)
+        _agent_cache[key] = agent
+    return agent
+
+
+# Built workflows are cached the same way: the builder pipeline
+# re-serialises JSON tool schemas (5 agents × several tools for handoff)
+# on every build, a repeated ms-scale cost when a server constructs the
+# workflow per request. Workflow graphs hold no per-conversation state —
+# each run gets its own runtime context — so reuse is safe.
+_workflow_cache: dict[tuple[int, str], Any] = {}
+
+
+def _cached_workflow(chat_client: Any, variant: str, build: Callable[[], Any]) -> Any:
+    key = (id(chat_client), variant)
+    workflow = _workflow_cache.get(key)
+    if workflow is None:
+        workflow = build()
+        _workflow_cache[key] = workflow
+    return workflow
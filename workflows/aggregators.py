@@ -0,0 +1,69 @@
+"""
+Aggregation strategies for the concurrent workflow's fan-in step.
+
+ConcurrentBuilder invokes the aggregator once, after every participant
+has responded, with the list of AgentExecutorResponse objects. These
+strategies therefore choose among completed answers — the latency-side
+early exit (cancel the stragglers) lives in the workflow's
+first_useful mode, not here.
+
+Usage:
+    build_concurrent_workflow(client, aggregator=best_of(len))
+    build_concurrent_workflow(client, aggregator=voting(str.strip))
+    build_concurrent_workflow(client, aggregator=first_valid(lambda t: "°C" in t))
+"""
+
+from collections import Counter
+from typing import Any, Callable
+
+
+def _response_text(result: Any) -> str:
+    msgs = result.agent_response.messages
+    return msgs[-1].text if msgs else ""
+
+
+def concat(results: list[Any]) -> str:
+    """Default strategy: every agent's answer, in ━━━-headed sections."""
+    return "\n\n".join(
+        f"━━━ {(r.executor_id or 'Agent').upper()} ━━━\n{_response_text(r) or '(no response)'}"
+        for r in results
+    )
+
+
+def best_of(scorer: Callable[[str], float]) -> Callable[[list[Any]], str]:
+    """Return the single answer that scores highest under scorer(text)."""
+
+    def _aggregate(results: list[Any]) -> str:
+        if not results:
+            return "(no responses)"
+        return _response_text(max(results, key=lambda r: scorer(_response_text(r))))
+
+    return _aggregate
+
+
+def voting(key: Callable[[str], Any]) -> Callable[[list[Any]], str]:
+    """Return an answer from the largest group of agents agreeing under key(text)."""
+
+    def _aggregate(results: list[Any]) -> str:
+        if not results:
+            return "(no responses)"
+        winner_key, _ = Counter(key(_response_text(r)) for r in results).most_common(1)[0]
+        for r in results:
+            if key(_response_text(r)) == winner_key:
+                return _response_text(r)
+        return _response_text(results[0])
+
+    return _aggregate
+
+
+def first_valid(predicate: Callable[[str], bool]) -> Callable[[list[Any]], str]:
+    """Return the first answer passing predicate, falling back to concat."""
+
+    def _aggregate(results: list[Any]) -> str:
+        for r in results:
+            text = _response_text(r)
+            if predicate(text):
+                return text
+        return concat(results)
+
+    return _aggregate
@@ -15,9 +15,13 @@ Architecture:
         └── BookingAgent   ──┘
 """
 
+import asyncio
+import io
+import logging
+import time
 from typing import Any
 
-from agent_framework import ConcurrentBuilder
+from agent_framework import ConcurrentBuilder, WorkflowOutputEvent
 from agent_framework.azure import AzureOpenAIChatClient
 
 from ..agents import (
@@ -25,6 +29,15 @@ from ..agents import (
     create_activities_agent,
     create_booking_agent,
 )
+from ._shared import _cached_workflow, _get_or_create
+from .telemetry import agent_latency, agent_span
+
+logger = logging.getLogger("travel_assistant")
+
+
+# Uppercased section headers, cached per executor id — the same three
+# agents head every aggregation, no need to re-uppercase each time.
+_UPPER_CACHE: dict[str, str] = {}
 
 
 def _summarize_results(results: list[Any]) -> str:
@@ -33,32 +46,142 @@ def _summarize_results(results: list[Any]) -> str:
 
     Receives a list of AgentExecutorResponse objects and combines
     the last message from each agent into a structured output.
+    Aggregation gates the user-visible response after fan-out, so the
+    sections are written into one StringIO buffer rather than building
+    a list of f-strings and joining.
     """
-    sections = []
+    buf = io.StringIO()
+    write = buf.write
     for r in results:
         agent_name = r.executor_id or "Agent"
         # Get the last assistant message from the agent's response
         last_msg = r.agent_response.messages[-1].text if r.agent_response.messages else "(no response)"
-        sections.append(f"━━━ {agent_name.upper()} ━━━\n{last_msg}")
+        write("━━━ ")
+        write(_UPPER_CACHE.setdefault(agent_name, agent_name.upper()))
+        write(" ━━━\n")
+        write(last_msg)
+        write("\n\n")
+
+    return buf.getvalue().rstrip()
+
+
+_FIRST_USEFUL_TIMEOUT = 45.0  # ceiling before a straggling agent is abandoned
 
-    return "\n\n".join(sections)
 
+async def _timed_run(agent: Any, name: str, user_request: str):
+    with agent_span(name):
+        return await agent.run(user_request)
 
-def build_concurrent_workflow(chat_client: AzureOpenAIChatClient):
+
+class _FirstUsefulRacer:
+    """
+    run_stream-compatible racer over the specialist agents.
+
+    ConcurrentBuilder has no early-termination hook — its aggregator only
+    fires once every participant has finished, so fan-out latency is
+    max(t_i). For queries any single specialist can answer, this races
+    the agents directly, takes the first non-empty response, and cancels
+    the rest, making latency min(t_i) of the useful agents.
+
+    Each entrant gets its own deadline from the telemetry tracker's EMA
+    of its past latency, capped by _FIRST_USEFUL_TIMEOUT, so a stalled
+    agent is cancelled as soon as it runs well past its usual pace
+    rather than holding the race open until the global ceiling.
+    """
+
+    def __init__(self, agents: list[Any]) -> None:
+        self._agents = agents
+
+    async def run_stream(self, user_request: str):
+        tasks = {
+            asyncio.create_task(_timed_run(agent, name, user_request)): name
+            for name, agent in (
+                (agent.name or f"agent_{i}", agent) for i, agent in enumerate(self._agents)
+            )
+        }
+        now = time.monotonic()
+        deadlines = {
+            task: now + agent_latency.timeout_for(name, _FIRST_USEFUL_TIMEOUT)
+            for task, name in tasks.items()
+        }
+        pending = set(tasks)
+        winner_name: str | None = None
+        winner_text: str | None = None
+        try:
+            while pending and winner_text is None:
+                # Wake at the nearest per-agent deadline, not a global one.
+                timeout = min(deadlines[t] for t in pending) - time.monotonic()
+                done, pending = await asyncio.wait(
+                    pending, timeout=max(timeout, 0.0), return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.cancelled() or task.exception() is not None:
+                        continue
+                    text = (task.result().text or "").strip()
+                    if text:
+                        winner_name, winner_text = tasks[task], text
+                        break
+                # Cancel anything past its own deadline so one straggler
+                # can't block the race while faster agents are still due.
+                now = time.monotonic()
+                for task in [t for t in pending if now >= deadlines[t]]:
+                    logger.warning("first_useful: cancelling straggler %s", tasks[task])
+                    task.cancel()
+                    pending.discard(task)
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if winner_text is None:
+            winner_name, winner_text = "concurrent", "(no agent produced a useful answer)"
+        header = _UPPER_CACHE.setdefault(winner_name, winner_name.upper())
+        yield WorkflowOutputEvent(
+            data=f"━━━ {header} ━━━\n{winner_text}",
+            source_executor_id=winner_name,
+        )
+
+
+def build_concurrent_workflow(chat_client: AzureOpenAIChatClient, mode: str = "all", aggregator=None):
     """
     Build a concurrent workflow: weather + activities + booking in parallel.
 
-    Uses a custom aggregator to merge all agent responses into a
-    structured multi-section output.
+    Modes:
+        "all" — every agent answers; the aggregator merges the
+            responses. Defaults to the structured multi-section concat;
+            pass any strategy from workflows.aggregators (or a custom
+            callable taking the results list) to choose differently,
+            e.g. aggregator=first_valid(...) for quality gating.
+        "first_useful" — the agents race and the first non-empty answer
+            wins; the rest are cancelled. For queries satisfiable by a
+            single specialist this cuts latency from max to min.
+
+    The built workflow is cached per (chat client, mode). Custom
+    aggregators are typically fresh closures — best_of(len) mints one
+    per call — so caching on their identity would add an immortal cache
+    entry per call; those builds are returned uncached instead (the
+    agents themselves still come from the shared agent cache).
     """
-    weather = create_weather_agent(chat_client)
-    activities = create_activities_agent(chat_client)
-    booking = create_booking_agent(chat_client)
+    if mode not in ("all", "first_useful"):
+        raise ValueError(f"Unknown mode: {mode}. Choose 'all' or 'first_useful'.")
+    if aggregator is not None:
+        return _build_concurrent_workflow(chat_client, mode, aggregator)
+    return _cached_workflow(
+        chat_client, f"concurrent:{mode}", lambda: _build_concurrent_workflow(chat_client, mode)
+    )
+
+
+def _build_concurrent_workflow(chat_client: AzureOpenAIChatClient, mode: str, aggregator=None):
+    weather = _get_or_create(chat_client, "weather", create_weather_agent)
+    activities = _get_or_create(chat_client, "activities", create_activities_agent)
+    booking = _get_or_create(chat_client, "booking", create_booking_agent)
+
+    if mode == "first_useful":
+        return _FirstUsefulRacer([weather, activities, booking])
 
     workflow = (
         ConcurrentBuilder()
         .participants([weather, activities, booking])
-        .with_aggregator(_summarize_results)
+        .with_aggregator(aggregator or _summarize_results)
         .build()
     )
 
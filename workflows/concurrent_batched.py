@@ -0,0 +1,73 @@
+"""
+Batched Concurrent Workflow — one LLM call for all three perspectives.
+
+The regular concurrent workflow fans the same user question out to the
+weather, activities and booking agents as three independent completions,
+paying 3x network, queueing and rate-limit cost for one question. This
+variant marshals all three personas into a single "multi-perspective"
+agent whose prompt asks for three delimited sections, then normalises
+the sections into the same ━━━-headed format the concurrent
+aggregator produces.
+
+Trade-off: one completion generates all three answers sequentially
+token-wise, so total generation time can exceed the parallel fan-out's —
+but it costs one request slot instead of three, which is what matters
+under RPM limits or per-request billing.
+
+Architecture:
+    User Request → MultiPerspectiveAgent → section splitter → Combined Output
+"""
+
+import re
+
+from agent_framework import WorkflowOutputEvent
+from agent_framework.azure import AzureOpenAIChatClient
+
+from ..agents import create_multi_perspective_agent
+from ._shared import _cached_workflow, _get_or_create
+
+_SECTION_RE = re.compile(r"━━━\s*([A-Za-z_ ]+?)\s*━━━\n?")
+
+
+def _normalise_sections(text: str) -> str:
+    """Re-emit the model's delimited sections in canonical aggregator form."""
+    parts = _SECTION_RE.split(text)
+    if len(parts) < 3:
+        # The model ignored the delimiter format; pass its answer through.
+        return text.strip()
+    sections = [
+        f"━━━ {name.upper()} ━━━\n{body.strip()}"
+        for name, body in zip(parts[1::2], parts[2::2])
+    ]
+    return "\n\n".join(sections)
+
+
+class _BatchedConcurrent:
+    """run_stream-compatible wrapper around the multi-perspective agent."""
+
+    def __init__(self, agent) -> None:
+        self._agent = agent
+
+    async def run_stream(self, user_request: str):
+        response = await self._agent.run(user_request)
+        yield WorkflowOutputEvent(
+            data=_normalise_sections(response.text or ""),
+            source_executor_id="multi_perspective_agent",
+        )
+
+
+def build_batched_concurrent_workflow(chat_client: AzureOpenAIChatClient):
+    """
+    Build the batched variant of the concurrent workflow.
+
+    One completion answers for all three specialists; output format
+    matches build_concurrent_workflow's aggregated sections. Cached per
+    chat client like the other builders.
+    """
+    return _cached_workflow(
+        chat_client,
+        "concurrent_batched",
+        lambda: _BatchedConcurrent(
+            _get_or_create(chat_client, "multi_perspective", create_multi_perspective_agent)
+        ),
+    )
@@ -16,6 +16,8 @@ Architecture:
               └── handoff_to_booking_agent  → BookingAgent
 """
 
+from types import MappingProxyType
+
 from agent_framework import HandoffBuilder
 from agent_framework.azure import AzureOpenAIChatClient
 
@@ -26,6 +28,139 @@ from ..agents import (
     create_activities_agent,
     create_booking_agent,
 )
+from ._shared import _cached_workflow, _get_or_create
+
+
+_TERMINATION_LIMIT = 10
+
+# Routing topology, assembled once at module load and frozen — the build
+# step just walks it, and nothing downstream can mutate the graph that
+# the registered edges (and their cached tool schemas) were derived from.
+_HANDOFF_GRAPH = MappingProxyType({
+    "triage": ("weather", "packing", "activities", "booking"),
+    "weather": ("packing", "activities"),  # weather can chain to packing or activities
+    "activities": ("booking",),            # activities can suggest bookings
+    "booking": ("weather",),               # booking can check weather for travel dates
+})
+
+# Each handoff re-sends the conversation as the receiving agent's prompt,
+# so a triage → weather → packing → booking chain pays O(turns × tokens)
+# per hop on the full transcript. Recent turns carry the user's actual
+# question and the latest tool results; older ones are mostly routing
+# chatter the specialist doesn't need.
+_HANDOFF_HISTORY_LIMIT = 8
+
+# Turn count alone doesn't bound prefill cost — eight messages can be
+# eight short routing lines or eight full tool-result dumps. A reverse
+# cumulative character scan enforces a hard budget on top of the turn
+# limit, dropping the oldest survivors first. ~4 chars/token is the
+# usual English heuristic, so this approximates a 4096-token cap.
+_HANDOFF_CHAR_BUDGET = 4096 * 4
+
+
+def _truncate_to_budget(messages: list) -> list:
+    """Keep the newest messages whose combined text fits the char budget."""
+    remaining = _HANDOFF_CHAR_BUDGET
+    kept = 0
+    for m in reversed(messages):
+        remaining -= len(getattr(m, "text", None) or "")
+        if remaining < 0:
+            break
+        kept += 1
+    if kept == len(messages):
+        return messages
+    # Never hand off an empty conversation, even if the newest message
+    # alone blows the budget.
+    return messages[-kept:] if kept else messages[-1:]
+
+
+def _call_result_ids(message) -> tuple[set, set]:
+    """Split a message's content call_ids into (calls made, results carried).
+
+    Function-call contents carry both a name and a call_id; result
+    contents carry only the call_id. That asymmetry is how the pair is
+    told apart without importing framework content types.
+    """
+    calls, results = set(), set()
+    for c in getattr(message, "contents", None) or ():
+        cid = getattr(c, "call_id", None)
+        if not cid:
+            continue
+        (calls if getattr(c, "name", None) else results).add(cid)
+    return calls, results
+
+
+def _drop_orphaned_results(messages: list) -> list:
+    """Drop result messages whose originating call message isn't present.
+
+    Any front cut (turn limit, char budget) or scrub can separate a tool
+    result from its call; a history opening with an orphaned result is
+    exactly the malformed-conversation shape these filters exist to
+    prevent.
+    """
+    seen_calls: set = set()
+    kept = []
+    for m in messages:
+        calls, results = _call_result_ids(m)
+        if results - seen_calls:
+            continue
+        seen_calls |= calls
+        kept.append(m)
+    return kept if kept else messages[-1:]
+
+
+def _prune_history(messages: list) -> list:
+    """Input filter: keep only the newest budget-fitting messages."""
+    if len(messages) > _HANDOFF_HISTORY_LIMIT:
+        messages = messages[-_HANDOFF_HISTORY_LIMIT:]
+    return _drop_orphaned_results(_truncate_to_budget(messages))
+
+
+def _make_edge_filter(target_agent):
+    """
+    Build the input filter for a handoff edge into target_agent.
+
+    Scrubs messages whose function calls reference tools the target
+    doesn't have — a cold agent seeing get_weather calls it can't make
+    tends to hallucinate its own, wasting a full round-trip on the error
+    correction — then prunes to the history limit. A scrubbed call takes
+    its result messages with it (matched by call_id), so the survivors
+    stay a well-formed call/result conversation. handoff_to_* calls are
+    framework routing, not agent tools, and pass through untouched.
+    """
+    tools = getattr(target_agent, "tools", None) or []
+    allowed = {name for name in (getattr(t, "name", None) for t in tools) if name}
+
+    def _edge_filter(messages: list) -> list:
+        kept = []
+        scrubbed_ids: set = set()
+        for m in messages:
+            called = {
+                name
+                for name in (getattr(c, "name", None) for c in getattr(m, "contents", None) or ())
+                if name and not name.startswith("handoff_to_")
+            }
+            calls, results = _call_result_ids(m)
+            if called and not called <= allowed:
+                scrubbed_ids |= calls
+                continue
+            if results & scrubbed_ids:
+                continue
+            kept.append(m)
+        return _prune_history(kept)
+
+    return _edge_filter
+
+
+def _terminate_on_length(conversation) -> bool:
+    """Stop once the exchange reaches the turn limit.
+
+    The framework hands us a message list, so len() is an O(1) size
+    read. Deliberately stateless: built workflows are cached and reused
+    across runs, so a per-build counter closure would carry state from
+    one conversation into the next.
+    """
+    return len(conversation) >= _TERMINATION_LIMIT
 
 
 def build_handoff_workflow(chat_client: AzureOpenAIChatClient):
@@ -33,30 +168,33 @@ def build_handoff_workflow(chat_client: AzureOpenAIChatClient):
     Build a handoff workflow where triage routes to specialists.
 
     Specialists can hand off between each other for multi-topic requests.
-    Conversation history is preserved across all handoffs.
+    Conversation history is pruned and scrubbed per handoff edge.
+    The built workflow is cached per chat client and reused across runs.
     """
-    triage = create_triage_agent(chat_client)
-    weather = create_weather_agent(chat_client)
-    packing = create_packing_agent(chat_client)
-    activities = create_activities_agent(chat_client)
-    booking = create_booking_agent(chat_client)
-
-    workflow = (
-        HandoffBuilder(
-            name="travel_assistant_handoff",
-            participants=[triage, weather, packing, activities, booking],
-        )
-        .with_start_agent(triage)
-        # Configure directed handoffs: who can route to whom
-        .add_handoff(triage, [weather, packing, activities, booking])
-        .add_handoff(weather, [packing, activities])  # weather can chain to packing or activities
-        .add_handoff(activities, [booking])            # activities can suggest bookings
-        .add_handoff(booking, [weather])               # booking can check weather for travel dates
-        # Terminate after a reasonable exchange
-        .with_termination_condition(
-            lambda conversation: len(conversation) >= 10
-        )
-        .build()
-    )
-
-    return workflow
\ No newline at end of file
+    return _cached_workflow(chat_client, "handoff", lambda: _build_handoff_workflow(chat_client))
+
+
+def _build_handoff_workflow(chat_client: AzureOpenAIChatClient):
+    agents = {
+        "triage": _get_or_create(chat_client, "triage", create_triage_agent),
+        "weather": _get_or_create(chat_client, "weather", create_weather_agent),
+        "packing": _get_or_create(chat_client, "packing", create_packing_agent),
+        "activities": _get_or_create(chat_client, "activities", create_activities_agent),
+        "booking": _get_or_create(chat_client, "booking", create_booking_agent),
+    }
+
+    builder = HandoffBuilder(
+        name="travel_assistant_handoff",
+        participants=list(agents.values()),
+    ).with_start_agent(agents["triage"])
+
+    # Walk the frozen routing graph once. Edges are added one target at
+    # a time because each edge's input filter is built for its receiving
+    # agent (foreign-tool scrub + history prune).
+    for source, targets in _HANDOFF_GRAPH.items():
+        for target in targets:
+            agent = agents[target]
+            builder = builder.add_handoff(agents[source], [agent], input_filter=_make_edge_filter(agent))
+
+    # Terminate after a reasonable exchange
+    return builder.with_termination_condition(_terminate_on_length).build()
\ No newline at end of file
@@ -21,6 +21,25 @@ from ..agents import (
     create_weather_agent,
     create_packing_agent,
 )
+from ._shared import _cached_workflow, _get_or_create
+
+
+async def warm_packing_prefix(chat_client: AzureOpenAIChatClient) -> None:
+    """
+    Fire-and-forget prefix warm-up for the packing agent.
+
+    The sequential pipeline is strictly serial — packing waits for the
+    full weather answer — but packing's system prompt and tool schemas
+    are static and known up front. Sending them ahead with max_tokens=1
+    lets the server's prompt-prefix cache absorb the prefill while the
+    weather turn is still running, so the real packing call only pays
+    for the novel suffix. Purely advisory: any failure is swallowed.
+    """
+    packing = _get_or_create(chat_client, "packing", create_packing_agent)
+    try:
+        await packing.run("(prefix warm-up — reply with one token)", max_tokens=1)
+    except Exception:  # noqa: BLE001 — a failed warm-up must never surface
+        pass
 
 
 def build_sequential_workflow(chat_client: AzureOpenAIChatClient):
@@ -29,9 +48,14 @@ def build_sequential_workflow(chat_client: AzureOpenAIChatClient):
 
     The packing agent sees the weather agent's response in the
     conversation history, so it can tailor its suggestions.
+    The built workflow is cached per chat client and reused across runs.
     """
-    weather = create_weather_agent(chat_client)
-    packing = create_packing_agent(chat_client)
+    return _cached_workflow(chat_client, "sequential", lambda: _build_sequential_workflow(chat_client))
+
+
+def _build_sequential_workflow(chat_client: AzureOpenAIChatClient):
+    weather = _get_or_create(chat_client, "weather", create_weather_agent)
+    packing = _get_or_create(chat_client, "packing", create_packing_agent)
 
     workflow = (
         SequentialBuilder()
@@ -0,0 +1,89 @@
+"""
+Latency telemetry for the fan-out workflows.
+
+Keeps an exponentially weighted moving average (EMA) of each agent's
+response latency, plus an EMA of its deviation, so fan-out paths can set
+per-agent timeouts from observed behaviour instead of one blanket
+constant. A straggler is then an agent running well past its *own*
+typical latency — a slow-but-steady booking agent isn't cut off by a
+budget tuned for the fast weather agent, and a normally-fast agent that
+stalls gets cancelled long before the global ceiling.
+
+When opentelemetry is installed, agent_span() additionally emits a span
+per agent invocation so stragglers show up in trace views; without it,
+timing still feeds the EMA and the span is a no-op.
+"""
+
+import time
+from contextlib import contextmanager, nullcontext
+
+try:
+    import opentelemetry.trace as _otel_trace
+except ImportError:
+    _otel_trace = None
+
+_EMA_ALPHA = 0.2           # weight of the newest sample
+_TIMEOUT_MULTIPLIER = 1.5  # headroom over the tracked tail latency
+_MIN_TIMEOUT = 5.0         # never cut an agent off faster than this
+
+
+class LatencyTracker:
+    """Per-agent latency EMA feeding adaptive timeouts."""
+
+    def __init__(self, alpha: float = _EMA_ALPHA) -> None:
+        self._alpha = alpha
+        self._ema: dict[str, float] = {}
+        self._dev: dict[str, float] = {}
+
+    def record(self, agent_id: str, seconds: float) -> None:
+        """Fold one completed invocation's latency into the agent's EMA."""
+        prev = self._ema.get(agent_id)
+        if prev is None:
+            self._ema[agent_id] = seconds
+            self._dev[agent_id] = 0.0
+        else:
+            self._ema[agent_id] = prev + self._alpha * (seconds - prev)
+            prev_dev = self._dev[agent_id]
+            self._dev[agent_id] = prev_dev + self._alpha * (abs(seconds - prev) - prev_dev)
+
+    def timeout_for(self, agent_id: str, default: float) -> float:
+        """
+        Adaptive timeout for one agent invocation.
+
+        ema + 3·dev approximates the latency tail under the EMA model
+        (the p99 stand-in), widened by the multiplier for headroom. The
+        result only ever tightens the caller's default — an agent with
+        no history, or a genuinely slow one, keeps the blanket budget.
+        """
+        ema = self._ema.get(agent_id)
+        if ema is None:
+            return default
+        tail = ema + 3.0 * self._dev[agent_id]
+        return max(_MIN_TIMEOUT, min(default, tail * _TIMEOUT_MULTIPLIER))
+
+
+# Process-lifetime tracker shared by the fan-out paths. Agents are cached
+# per chat client, so latencies observed early in a session directly
+# predict later invocations of the same agent.
+agent_latency = LatencyTracker()
+
+
+@contextmanager
+def agent_span(agent_id: str):
+    """
+    Time one agent invocation, feeding the shared tracker on success.
+
+    Failures and cancellations don't record a sample — a straggler cut
+    off at its deadline would otherwise drag its EMA down and tighten
+    the next timeout further. Emits an opentelemetry span when the
+    library is present.
+    """
+    span = (
+        _otel_trace.get_tracer("travel_assistant").start_as_current_span(f"agent.{agent_id}")
+        if _otel_trace is not None
+        else nullcontext()
+    )
+    start = time.perf_counter()
+    with span:
+        yield
+        agent_latency.record(agent_id, time.perf_counter() - start)